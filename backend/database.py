@@ -4,19 +4,26 @@ from models import Base
 from config.settings import settings
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+import orjson
 import pymysql
 pymysql.install_as_MySQLdb()
 
 logger = logging.getLogger(__name__)
 
-# Create engine with AWS RDS connection
+# Create engine with AWS RDS connection.
+# There is no psycopg2-style batch flag for MySQL; bulk writes build one
+# multi-row statement explicitly (JobMandateService.add_items_bulk uses
+# insert(Model).values(rows)).
 engine = create_engine(
     settings.DATABASE_URL,
     pool_size=5,
     max_overflow=10,
     pool_timeout=30,
     pool_recycle=1800,
-    pool_pre_ping=True
+    pool_pre_ping=True,
+    # JSON columns (preferences, section_statuses, ...) go through orjson
+    json_serializer=lambda value: orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode(),
+    json_deserializer=orjson.loads
 )
 
 # Create sessionmaker
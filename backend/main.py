@@ -7,7 +7,7 @@ from middleware import LoggingMiddleware
 from pydantic import ValidationError
 from starlette.responses import JSONResponse
 from tools import register_all_builtin_tools
-from workflows.templates import register_all_workflows
+import workflows.templates  # Registers the built-in templates (imported on first use)
 
 # Setup logging first
 logger, request_id_filter = setup_logging()
@@ -73,8 +73,6 @@ async def startup_event():
     logger.info("Database initialized")
     register_all_builtin_tools()
     logger.info("Tools registered")
-    register_all_workflows()
-    logger.info("Workflows registered")
 
 
 @app.get("/")
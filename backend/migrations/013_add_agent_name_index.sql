@@ -0,0 +1,3 @@
+-- Index agent lookups by owner and name (get_agent tool resolves agents by name)
+
+CREATE INDEX idx_autonomous_agents_user_name ON autonomous_agents(user_id, name);
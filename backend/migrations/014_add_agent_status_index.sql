@@ -0,0 +1,3 @@
+-- Index agent listings by owner and status (list_agents can exclude completed agents)
+
+CREATE INDEX idx_autonomous_agents_user_status ON autonomous_agents(user_id, status);
@@ -5,7 +5,7 @@ Simplified models for the personal AI agent system.
 Core entities: Users, Profiles, Conversations, Messages, Memories, Assets
 """
 
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, JSON, Enum, Float
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, JSON, Enum, Float, Index, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -271,6 +271,11 @@ class Asset(Base):
 class AutonomousAgent(Base):
     """Definition of an autonomous background agent"""
     __tablename__ = "autonomous_agents"
+    __table_args__ = (
+        # Mirrors migrations 013/014: name lookups and status-filtered listings per user
+        Index("idx_autonomous_agents_user_name", "user_id", "name"),
+        Index("idx_autonomous_agents_user_status", "user_id", "status"),
+    )
 
     agent_id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False, index=True)
@@ -416,7 +421,7 @@ class JobMandate(Base):
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=func.utc_timestamp())  # Set by MySQL on every UPDATE
     completed_at = Column(DateTime, nullable=True)
 
     # Relationships
@@ -445,7 +450,7 @@ class JobMandateItem(Base):
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=func.utc_timestamp())  # Set by MySQL on every UPDATE
 
     # Relationships
     mandate = relationship("JobMandate", back_populates="items")
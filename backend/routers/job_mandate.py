@@ -6,6 +6,7 @@ Handles job mandate CRUD and the interview chat flow.
 
 import asyncio
 from fastapi import APIRouter, Depends, Request, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from sse_starlette.sse import EventSourceResponse
 from pydantic import BaseModel
@@ -87,7 +88,13 @@ class MandateResponse(BaseModel):
 # Interview Endpoints
 # ============================================================================
 
-@router.post("/start", response_model=StartInterviewResponse)
+# Handlers below build plain-JSON payloads and return ORJSONResponse directly, so there
+# is no response_model; `responses` only documents the payload shape in OpenAPI
+@router.post(
+    "/start",
+    response_class=ORJSONResponse,
+    responses={200: {"model": StartInterviewResponse}}
+)
 async def start_interview(
     mandate_id: Optional[int] = None,
     db: Session = Depends(get_db),
@@ -124,13 +131,15 @@ async def start_interview(
     # Get interview state
     interview_state = mandate_service.get_interview_state(mandate.mandate_id)
 
-    return StartInterviewResponse(
-        mandate_id=mandate.mandate_id,
-        conversation_id=mandate.conversation_id,
-        is_new=is_new,
-        opening_message=opening_message,
-        interview_state=_format_interview_state(interview_state)
-    )
+    # Already plain JSON types; serialize once with orjson instead of
+    # validating through a response_model + jsonable_encoder
+    return ORJSONResponse(content={
+        "mandate_id": mandate.mandate_id,
+        "conversation_id": mandate.conversation_id,
+        "is_new": is_new,
+        "opening_message": opening_message,
+        "interview_state": _format_interview_state(interview_state)
+    })
 
 
 @router.post("/{mandate_id}/chat/stream", response_class=EventSourceResponse)
@@ -196,7 +205,11 @@ async def list_mandates(
     ]
 
 
-@router.get("/{mandate_id}", response_model=MandateResponse)
+@router.get(
+    "/{mandate_id}",
+    response_class=ORJSONResponse,
+    responses={200: {"model": MandateResponse}}
+)
 async def get_mandate(
     mandate_id: int,
     db: Session = Depends(get_db),
@@ -211,18 +224,18 @@ async def get_mandate(
 
     interview_state = mandate_service.get_interview_state(mandate_id)
 
-    return MandateResponse(
-        id=mandate.mandate_id,
-        user_id=mandate.user_id,
-        status=mandate.status.value,
-        current_section=mandate.current_section.value if mandate.status.value != "completed" else None,
-        conversation_id=mandate.conversation_id,
-        sections=_format_interview_state(interview_state)["sections"],
-        summary=mandate.summary,
-        created_at=mandate.created_at.isoformat(),
-        updated_at=mandate.updated_at.isoformat(),
-        completed_at=mandate.completed_at.isoformat() if mandate.completed_at else None
-    )
+    return ORJSONResponse(content={
+        "id": mandate.mandate_id,
+        "user_id": mandate.user_id,
+        "status": mandate.status.value,
+        "current_section": mandate.current_section.value if mandate.status.value != "completed" else None,
+        "conversation_id": mandate.conversation_id,
+        "sections": _format_interview_state(interview_state)["sections"],
+        "summary": mandate.summary,
+        "created_at": mandate.created_at.isoformat(),
+        "updated_at": mandate.updated_at.isoformat(),
+        "completed_at": mandate.completed_at.isoformat() if mandate.completed_at else None
+    })
 
 
 @router.delete("/{mandate_id}")
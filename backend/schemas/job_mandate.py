@@ -6,6 +6,7 @@ an LLM-guided interview process.
 """
 
 from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from typing import List, Optional, Literal
 from datetime import datetime
 from enum import Enum
@@ -181,10 +182,51 @@ class ExtractionResult(BaseModel):
     reasoning: Optional[str] = None  # Why the LLM made these extractions
 
 
-class InterviewState(BaseModel):
+# Interview state is rebuilt on every turn and never crosses the API boundary
+# as-is, so it uses plain dataclasses rather than validated Pydantic models.
+
+@dataclass(slots=True)
+class InterviewItem:
+    """Lightweight mandate item for interview state"""
+    id: int
+    content: str
+    category: Optional[str]
+    source: MandateItemSource
+    source_message_id: Optional[int]
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class InterviewSection:
+    """Lightweight mandate section for interview state"""
+    section_type: MandateSectionType
+    status: MandateSectionStatus = MandateSectionStatus.NOT_STARTED
+    items: List[InterviewItem] = field(default_factory=list)
+
+    # Cached bullet list of item contents; reset whenever items are added
+    _formatted_items: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def add_items(self, items: List[InterviewItem]) -> None:
+        """Append items and invalidate the formatted-items cache"""
+        self.items.extend(items)
+        self._formatted_items = None
+
+    def format_items(self) -> str:
+        """Format items as a bullet list for LLM prompts"""
+        if self._formatted_items is None:
+            if self.items:
+                self._formatted_items = "\n".join(f"- {item.content}" for item in self.items)
+            else:
+                self._formatted_items = "(none yet)"
+        return self._formatted_items
+
+
+@dataclass(slots=True)
+class InterviewState:
     """Current state of the interview, passed to LLM for context"""
     current_section: MandateSectionType
-    sections: dict[MandateSectionType, MandateSection]
+    sections: dict[MandateSectionType, InterviewSection]
 
     def format_for_prompt(self) -> str:
         """Format the current state for inclusion in LLM prompt"""
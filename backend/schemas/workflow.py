@@ -398,6 +398,13 @@ class WorkflowGraph:
         """Get a node by ID."""
         return self.nodes.get(node_id)
 
+    def register(self) -> "WorkflowGraph":
+        """Register this graph in the global workflow registry and return it."""
+        from workflows.registry import workflow_registry
+
+        workflow_registry.register(self)
+        return self
+
     def get_outgoing_edges(self, node_id: str) -> List[Edge]:
         """Get all edges leaving a node."""
         return [e for e in self.edges if e.from_node == node_id]
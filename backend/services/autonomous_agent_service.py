@@ -8,8 +8,9 @@ import json
 import logging
 import os
 from datetime import datetime, timedelta, date
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.orm import Session
 
 from models import (
@@ -25,6 +26,16 @@ from tools import get_tool
 
 logger = logging.getLogger(__name__)
 
+# Hot lookups built once at import; SQLAlchemy caches their compiled form
+_GET_AGENT_STMT = select(AutonomousAgent).where(
+    AutonomousAgent.agent_id == bindparam("agent_id"),
+    AutonomousAgent.user_id == bindparam("user_id")
+)
+_GET_RUN_STMT = select(AgentRun).where(AgentRun.run_id == bindparam("run_id"))
+_GET_AGENT_RUNS_STMT = select(AgentRun).where(
+    AgentRun.agent_id == bindparam("agent_id")
+).order_by(AgentRun.created_at.desc()).limit(bindparam("limit"))
+
 
 class AutonomousAgentService:
     """Service for managing autonomous background agents."""
@@ -82,10 +93,41 @@ class AutonomousAgentService:
 
     def get_agent(self, agent_id: int) -> Optional[AutonomousAgent]:
         """Get an agent by ID."""
-        return self.db.query(AutonomousAgent).filter(
+        return self.db.scalars(
+            _GET_AGENT_STMT, {"agent_id": agent_id, "user_id": self.user_id}
+        ).one_or_none()
+
+    def get_agent_with_recent_runs(
+        self,
+        agent_id: int,
+        runs_limit: int = 5
+    ) -> Tuple[Optional[AutonomousAgent], List[AgentRun]]:
+        """Get an agent and its most recent runs in a single query."""
+        rows = self.db.query(AutonomousAgent, AgentRun).outerjoin(
+            AgentRun, AgentRun.agent_id == AutonomousAgent.agent_id
+        ).filter(
             AutonomousAgent.agent_id == agent_id,
             AutonomousAgent.user_id == self.user_id
-        ).first()
+        ).order_by(AgentRun.created_at.desc()).limit(runs_limit).all()
+
+        if not rows:
+            return None, []
+        return rows[0][0], [run for _, run in rows if run is not None]
+
+    def find_agent_by_name(self, name: str) -> Optional[AutonomousAgent]:
+        """Find an agent by name: exact (case-insensitive) match first, then substring."""
+        query = self.db.query(AutonomousAgent).filter(
+            AutonomousAgent.user_id == self.user_id
+        ).order_by(AutonomousAgent.created_at.desc())
+
+        # The column's _ci collation already compares case-insensitively; comparing
+        # the bare column (no LOWER()) lets MySQL seek the (user_id, name) index
+        agent = query.filter(AutonomousAgent.name == name).first()
+        if agent:
+            return agent
+
+        # Substring fallback can't use the index (leading wildcard) but is limited to this user's agents
+        return query.filter(AutonomousAgent.name.contains(name, autoescape=True)).first()
 
     def list_agents(self, include_completed: bool = True) -> List[AutonomousAgent]:
         """List all agents for the user."""
@@ -193,13 +235,13 @@ class AutonomousAgentService:
 
     def get_run(self, run_id: int) -> Optional[AgentRun]:
         """Get a run by ID."""
-        return self.db.query(AgentRun).filter(AgentRun.run_id == run_id).first()
+        return self.db.scalars(_GET_RUN_STMT, {"run_id": run_id}).one_or_none()
 
     def get_agent_runs(self, agent_id: int, limit: int = 10) -> List[AgentRun]:
         """Get recent runs for an agent."""
-        return self.db.query(AgentRun).filter(
-            AgentRun.agent_id == agent_id
-        ).order_by(AgentRun.created_at.desc()).limit(limit).all()
+        return list(self.db.scalars(
+            _GET_AGENT_RUNS_STMT, {"agent_id": agent_id, "limit": limit}
+        ))
 
     # =========================================================================
     # Event Logging
@@ -441,7 +483,7 @@ class AutonomousAgentService:
                         self.db.add(asset)
                         self.db.flush()  # Test if insert works
                         run.assets_created = (run.assets_created or 0) + 1
-                        agent.total_assets_created = (agent.total_assets_created or 0) + 1
+                        agent.total_assets_created = func.coalesce(AutonomousAgent.total_assets_created, 0) + 1
 
                         self.log_event(
                             run_id,
@@ -459,8 +501,8 @@ class AutonomousAgentService:
                             {"error": str(asset_error)}
                         )
 
-            # Update agent stats
-            agent.total_runs += 1
+            # Update agent stats (incremented in SQL so concurrent runs don't lose counts)
+            agent.total_runs = func.coalesce(AutonomousAgent.total_runs, 0) + 1
             agent.last_run_at = datetime.utcnow()
 
             # Handle lifecycle-specific logic
@@ -541,7 +583,7 @@ class AutonomousAgentService:
             run.assets_created = (run.assets_created or 0) + 1
 
         # Update agent's total asset count
-        agent.total_assets_created = (agent.total_assets_created or 0) + 1
+        agent.total_assets_created = func.coalesce(AutonomousAgent.total_assets_created, 0) + 1
 
         self.db.commit()
         self.db.refresh(asset)
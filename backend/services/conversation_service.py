@@ -10,7 +10,7 @@ from sqlalchemy import desc
 from datetime import datetime
 import logging
 
-from models import Conversation, Message
+from models import Conversation, Message, JobMandate
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +34,19 @@ class ConversationService:
         logger.info(f"Created conversation {conversation.conversation_id} for user {self.user_id}")
         return conversation
 
+    def create_conversation_for_mandate(self, mandate: JobMandate) -> Conversation:
+        """Create a new conversation and link it to a mandate in one commit."""
+        conversation = Conversation(user_id=self.user_id)
+        self.db.add(conversation)
+        self.db.flush()  # Assigns conversation_id without committing
+
+        mandate.conversation_id = conversation.conversation_id
+        self.db.commit()
+        logger.info(
+            f"Created conversation {conversation.conversation_id} for mandate {mandate.mandate_id}"
+        )
+        return conversation
+
     def get_conversation(self, conversation_id: int) -> Optional[Conversation]:
         """Get a conversation by ID (must belong to user)."""
         return self.db.query(Conversation).filter(
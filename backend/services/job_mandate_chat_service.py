@@ -10,13 +10,16 @@ from typing import Dict, Any, AsyncGenerator, List, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
 import anthropic
+import asyncio
 import os
 import json
 import logging
+import orjson
 
 from models import MandateSectionType, MandateSectionStatus
 from schemas.job_mandate import (
     ExtractedInsight,
+    InterviewSection,
     InterviewState,
     MandateUpdateEvent,
     MandateStateUpdate,
@@ -30,6 +33,7 @@ from schemas.general_chat import (
     CompleteEvent,
     ErrorEvent,
 )
+from database import SessionLocal
 from services.job_mandate_service import JobMandateService
 from services.conversation_service import ConversationService
 
@@ -43,6 +47,26 @@ MIN_ITEMS_PER_SECTION = 3
 # Maximum items per section before we suggest moving on
 MAX_ITEMS_PER_SECTION = 10
 
+# Events buffered between the interview producer and a slow client
+STREAM_QUEUE_MAXSIZE = 32
+_STREAM_DONE = object()
+
+
+# Lazy-loaded client shared across service instances
+_async_client = None
+
+
+def _get_async_client() -> anthropic.AsyncAnthropic:
+    global _async_client
+    if _async_client is None:
+        _async_client = anthropic.AsyncAnthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+    return _async_client
+
+
+def _emit(event) -> str:
+    """Serialize a stream event to a JSON string via orjson."""
+    return orjson.dumps(event.model_dump(mode="json")).decode()
+
 
 # Tool definition for structured interview response
 INTERVIEW_RESPONSE_TOOL = {
@@ -94,7 +118,7 @@ class JobMandateChatService:
     def __init__(self, db: Session, user_id: int):
         self.db = db
         self.user_id = user_id
-        self.async_client = anthropic.AsyncAnthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+        self.async_client = _get_async_client()
         self.mandate_service = JobMandateService(db, user_id)
         self.conv_service = ConversationService(db, user_id)
 
@@ -116,24 +140,63 @@ class JobMandateChatService:
         2. If clear: extracts insights and determines if section is complete
         3. If unclear: asks a clarifying question
         4. Returns the conversational response
+
+        Events are handed over through a bounded queue so a slow client
+        backpressures the producer, and closing the stream cancels any
+        in-flight LLM call.
         """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_MAXSIZE)
+
+        async def produce():
+            try:
+                async for event in self._produce_interview_events(mandate_id, user_message, conversation_id):
+                    await queue.put(event)
+            except asyncio.CancelledError:
+                raise  # The consumer has gone away; nobody is waiting on the queue
+            except BaseException:
+                # Wake the consumer so it can re-raise this instead of waiting forever
+                await queue.put(_STREAM_DONE)
+                raise
+            await queue.put(_STREAM_DONE)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                event = await queue.get()
+                if event is _STREAM_DONE:
+                    break
+                yield event
+            # Surface a producer failure rather than ending the stream silently
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+            # Always collect the producer's outcome so its exception is retrieved
+            await asyncio.gather(producer, return_exceptions=True)
+
+    async def _produce_interview_events(
+        self,
+        mandate_id: int,
+        user_message: str,
+        conversation_id: Optional[int]
+    ) -> AsyncGenerator[str, None]:
+        """Run one interview turn, yielding serialized stream events."""
         try:
             # Get or validate mandate
             mandate = self.mandate_service.get_mandate(mandate_id)
             if not mandate:
-                yield ErrorEvent(message="Mandate not found").model_dump_json()
+                yield _emit(ErrorEvent(message="Mandate not found"))
                 return
 
             # Set up conversation if needed
             if conversation_id:
                 conv = self.conv_service.get_conversation(conversation_id)
                 if not conv:
-                    yield ErrorEvent(message="Conversation not found").model_dump_json()
+                    yield _emit(ErrorEvent(message="Conversation not found"))
                     return
             else:
-                conv = self.conv_service.create_conversation()
+                conv = self.conv_service.create_conversation_for_mandate(mandate)
                 conversation_id = conv.conversation_id
-                self.mandate_service.update_mandate_conversation(mandate_id, conversation_id)
 
             # Save user message
             user_msg = self.conv_service.add_message(
@@ -142,14 +205,16 @@ class JobMandateChatService:
                 content=user_message
             )
 
-            yield StatusEvent(message="Thinking...").model_dump_json()
+            yield _emit(StatusEvent(message="Thinking..."))
 
-            # Get current interview state
-            interview_state = self.mandate_service.get_interview_state(mandate_id)
+            # Load interview state and message history concurrently
+            interview_state, messages = await asyncio.gather(
+                asyncio.to_thread(self._get_interview_state_isolated, mandate_id),
+                asyncio.to_thread(self._load_message_history_isolated, conversation_id)
+            )
 
-            # Build system prompt and messages
+            # Build system prompt
             system_prompt = self._build_unified_system_prompt(interview_state)
-            messages = self._load_message_history(conversation_id)
 
             # Make unified LLM call with tool use
             response = await self.async_client.messages.create(
@@ -162,18 +227,24 @@ class JobMandateChatService:
                 temperature=0.7
             )
 
-            # Parse the tool use response
-            tool_use_block = None
-            for block in response.content:
-                if block.type == "tool_use" and block.name == "interview_response":
-                    tool_use_block = block
-                    break
+            # Parse the tool use response (forced tool_choice yields at most one tool_use block)
+            tool_use_block = next(
+                (block for block in response.content if block.type == "tool_use"), None
+            )
 
-            if not tool_use_block:
-                yield ErrorEvent(message="Failed to get structured response").model_dump_json()
-                return
+            if tool_use_block:
+                result = tool_use_block.input
+            else:
+                # Salvage any plain text the model returned as a clarifying reply
+                logger.warning(f"No interview_response tool use for mandate {mandate_id}; falling back to text")
+                text_content = "".join(
+                    block.text for block in response.content if block.type == "text"
+                ).strip()
+                result = {
+                    "action": "clarify",
+                    "response": text_content or "Could you tell me more?"
+                }
 
-            result = tool_use_block.input
             action = result.get("action", "clarify")
             insights = result.get("insights", [])
             section_complete = result.get("section_complete", False)
@@ -194,34 +265,42 @@ class JobMandateChatService:
                 )
                 new_items = items
 
+                # Apply the new items to the already-loaded state rather than re-querying
+                interview_state.sections[mandate.current_section].add_items(
+                    [self.mandate_service.item_to_schema(item) for item in new_items]
+                )
+
                 # Emit mandate update event
-                updated_state = self.mandate_service.get_interview_state(mandate_id)
-                yield MandateUpdateEvent(
-                    mandate=self._state_to_mandate_response(mandate_id, updated_state),
+                yield _emit(MandateUpdateEvent(
+                    mandate=self._state_to_mandate_response(mandate_id, interview_state),
                     new_items=[self._item_to_schema(item) for item in new_items]
-                ).model_dump_json()
+                ))
 
                 # Check if we should advance to next section
                 if section_complete:
-                    current_count = self.mandate_service.get_section_item_count(
-                        mandate_id, mandate.current_section
-                    )
+                    # The in-memory state already includes the items just added
+                    current_count = len(interview_state.sections[mandate.current_section].items)
                     if current_count >= MIN_ITEMS_PER_SECTION:
-                        self.mandate_service.advance_to_next_section(mandate_id)
+                        mandate = self.mandate_service.advance_to_next_section(mandate_id)
                         section_advanced = True
-                        mandate = self.mandate_service.get_mandate(mandate_id)
+
+                        # Sync section progress from the refreshed mandate
+                        interview_state.current_section = mandate.current_section
+                        for section_type, section in interview_state.sections.items():
+                            section.status = MandateSectionStatus(
+                                mandate.section_statuses.get(section_type.value, "not_started")
+                            )
 
                         # Emit another mandate update for section advance
-                        updated_state = self.mandate_service.get_interview_state(mandate_id)
-                        yield MandateUpdateEvent(
-                            mandate=self._state_to_mandate_response(mandate_id, updated_state),
+                        yield _emit(MandateUpdateEvent(
+                            mandate=self._state_to_mandate_response(mandate_id, interview_state),
                             new_items=[],
                             section_completed=MandateSectionType(mandate.current_section.value)
-                        ).model_dump_json()
+                        ))
 
             # Stream the response text
             for chunk in self._chunk_text(response_text, chunk_size=20):
-                yield TextDeltaEvent(text=chunk).model_dump_json()
+                yield _emit(TextDeltaEvent(text=chunk))
 
             # Save assistant message
             self.conv_service.add_message(
@@ -251,11 +330,18 @@ class JobMandateChatService:
                 )
             )
 
-            yield CompleteEvent(payload=final_payload).model_dump_json()
+            yield _emit(CompleteEvent(payload=final_payload))
 
+        except asyncio.CancelledError:
+            # Client disconnected mid-stream; nothing to report back
+            logger.warning(f"Interview chat cancelled for mandate {mandate_id}")
+            raise
+        except anthropic.APITimeoutError as e:
+            logger.warning(f"Interview chat timed out for mandate {mandate_id}: {e}")
+            yield _emit(ErrorEvent(message=f"Interview error: {str(e)}"))
         except Exception as e:
-            logger.error(f"Error in interview chat: {str(e)}", exc_info=True)
-            yield ErrorEvent(message=f"Interview error: {str(e)}").model_dump_json()
+            logger.exception(f"Error in interview chat for mandate {mandate_id}: {e}")
+            yield _emit(ErrorEvent(message=f"Interview error: {str(e)}"))
 
     async def get_opening_message(self, mandate_id: int) -> str:
         """Generate the opening message for an interview."""
@@ -280,8 +366,8 @@ class JobMandateChatService:
     def _build_unified_system_prompt(self, interview_state: InterviewState) -> str:
         """Build the system prompt for the unified interview LLM call."""
         current_section = interview_state.current_section
-        current_items = interview_state.sections[current_section].items
-        current_count = len(current_items)
+        current = interview_state.sections[current_section]
+        current_count = len(current.items)
 
         # Check overall progress
         all_complete = all(
@@ -303,7 +389,7 @@ class JobMandateChatService:
         **Focus:** {section_info['description']}
 
         **Items captured so far ({current_count}):**
-        {self._format_current_items(current_items)}
+        {self._format_current_items(current)}
 
         **Target:** {MIN_ITEMS_PER_SECTION}-{MAX_ITEMS_PER_SECTION} insights per section
 
@@ -396,11 +482,9 @@ class JobMandateChatService:
         }
         return info[section]
 
-    def _format_current_items(self, items: List) -> str:
-        """Format current items for the prompt."""
-        if not items:
-            return "(none yet)"
-        return "\n".join(f"- {item.content}" for item in items)
+    def _format_current_items(self, section: InterviewSection) -> str:
+        """Format current items for the prompt (cached on the section)."""
+        return section.format_items()
 
     def _get_next_section_intro(self, current_section: MandateSectionType) -> str:
         """Get the intro text for transitioning to the next section."""
@@ -447,30 +531,44 @@ class JobMandateChatService:
     # Helpers
     # =========================================================================
 
-    def _load_message_history(self, conversation_id: int) -> List[Dict[str, str]]:
-        """Load message history from database."""
-        db_messages = self.conv_service.get_messages(conversation_id)
-        return [
-            {"role": msg.role, "content": msg.content}
-            for msg in db_messages
-        ]
+    def _get_interview_state_isolated(self, mandate_id: int) -> Optional[InterviewState]:
+        """
+        Load interview state on a dedicated session.
 
-    def _chunk_text(self, text: str, chunk_size: int = 20) -> List[str]:
-        """Split text into chunks for streaming simulation."""
-        words = text.split(' ')
-        chunks = []
-        current_chunk = []
+        Runs in a worker thread that can outlive a cancelled stream, so it must
+        not touch the request-scoped session.
+        """
+        with SessionLocal() as db:
+            return JobMandateService(db, self.user_id).get_interview_state(mandate_id)
 
-        for word in words:
-            current_chunk.append(word)
-            if len(current_chunk) >= chunk_size:
-                chunks.append(' '.join(current_chunk) + ' ')
-                current_chunk = []
+    def _load_message_history_isolated(self, conversation_id: int) -> List[Dict[str, str]]:
+        """
+        Load message history on a dedicated session.
 
-        if current_chunk:
-            chunks.append(' '.join(current_chunk))
+        Sessions are not thread-safe, so this gets its own connection when run
+        alongside other queries on the request session.
+        """
+        with SessionLocal() as db:
+            db_messages = ConversationService(db, self.user_id).get_messages(conversation_id)
+            return [
+                {"role": msg.role, "content": msg.content}
+                for msg in db_messages
+            ]
 
-        return chunks if chunks else [text]
+    def _chunk_text(self, text: str, chunk_size: int = 20) -> List[str]:
+        """Split text into chunks for streaming simulation."""
+        words = text.split(' ')
+        if len(words) <= chunk_size:
+            return [text]
+
+        # Every chunk but the last keeps a trailing space so the client can
+        # concatenate deltas back into the original text.
+        chunks = [
+            ' '.join(words[i:i + chunk_size]) + ' '
+            for i in range(0, len(words), chunk_size)
+        ]
+        chunks[-1] = chunks[-1][:-1]
+        return chunks
 
     def _state_to_mandate_response(self, mandate_id: int, state: InterviewState) -> MandateStateUpdate:
         """Convert interview state to API response format."""
@@ -4,8 +4,11 @@ Job Mandate Service
 Handles CRUD operations and business logic for job mandates.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+from itertools import groupby
+from operator import itemgetter
 from datetime import datetime
+from sqlalchemy import insert, update, select, func
 from sqlalchemy.orm import Session
 import logging
 
@@ -18,14 +21,29 @@ from models import (
     MandateItemSource,
 )
 from schemas.job_mandate import (
-    MandateSection,
-    MandateItem as MandateItemSchema,
+    InterviewItem,
+    InterviewSection,
     InterviewState,
     ExtractedInsight,
 )
 
 logger = logging.getLogger(__name__)
 
+SECTION_ORDER: Tuple[MandateSectionType, ...] = (
+    MandateSectionType.ENERGIZES,
+    MandateSectionType.STRENGTHS,
+    MandateSectionType.MUST_HAVES,
+    MandateSectionType.DEAL_BREAKERS,
+)
+SECTION_INDEX: Dict[MandateSectionType, int] = {section: i for i, section in enumerate(SECTION_ORDER)}
+
+ALL_SECTIONS_COMPLETED = {
+    "energizes": "completed",
+    "strengths": "completed",
+    "must_haves": "completed",
+    "deal_breakers": "completed"
+}
+
 
 class JobMandateService:
     """Service for managing job mandates."""
@@ -33,6 +51,8 @@ class JobMandateService:
     def __init__(self, db: Session, user_id: int):
         self.db = db
         self.user_id = user_id
+        # Mandates loaded by this (request-scoped) service, keyed by id
+        self._mandate_cache: Dict[int, JobMandate] = {}
 
     # =========================================================================
     # Mandate CRUD
@@ -55,15 +75,28 @@ class JobMandateService:
         self.db.add(mandate)
         self.db.commit()
         self.db.refresh(mandate)
+        self._mandate_cache[mandate.mandate_id] = mandate
         logger.info(f"Created job mandate {mandate.mandate_id} for user {self.user_id}")
         return mandate
 
     def get_mandate(self, mandate_id: int) -> Optional[JobMandate]:
-        """Get a mandate by ID."""
-        return self.db.query(JobMandate).filter(
-            JobMandate.mandate_id == mandate_id,
-            JobMandate.user_id == self.user_id
-        ).first()
+        """Get a mandate by ID (cached for the lifetime of this service)."""
+        mandate = self._mandate_cache.get(mandate_id)
+        if mandate is None:
+            mandate = self.db.query(JobMandate).filter(
+                JobMandate.mandate_id == mandate_id,
+                JobMandate.user_id == self.user_id
+            ).first()
+            if mandate:
+                self._mandate_cache[mandate_id] = mandate
+        return mandate
+
+    def invalidate_mandate_cache(self, mandate_id: Optional[int] = None) -> None:
+        """Drop cached mandates so the next get_mandate re-queries."""
+        if mandate_id is None:
+            self._mandate_cache.clear()
+        else:
+            self._mandate_cache.pop(mandate_id, None)
 
     def get_active_mandate(self) -> Optional[JobMandate]:
         """Get the user's current in-progress mandate, if any."""
@@ -78,43 +111,44 @@ class JobMandateService:
             JobMandate.user_id == self.user_id
         ).order_by(JobMandate.created_at.desc()).all()
 
-    def update_mandate_conversation(self, mandate_id: int, conversation_id: int) -> Optional[JobMandate]:
-        """Associate a conversation with a mandate."""
-        mandate = self.get_mandate(mandate_id)
-        if mandate:
-            mandate.conversation_id = conversation_id
-            mandate.updated_at = datetime.utcnow()
-            self.db.commit()
-            self.db.refresh(mandate)
-        return mandate
-
     def complete_mandate(self, mandate_id: int, summary: Optional[str] = None) -> Optional[JobMandate]:
         """Mark a mandate as completed."""
-        mandate = self.get_mandate(mandate_id)
-        if mandate:
-            mandate.status = MandateStatus.COMPLETED
-            mandate.completed_at = datetime.utcnow()
-            mandate.updated_at = datetime.utcnow()
-            if summary:
-                mandate.summary = summary
-            # Mark all sections as completed
-            mandate.section_statuses = {
-                "energizes": "completed",
-                "strengths": "completed",
-                "must_haves": "completed",
-                "deal_breakers": "completed"
-            }
-            self.db.commit()
-            self.db.refresh(mandate)
-            logger.info(f"Completed job mandate {mandate_id}")
-        return mandate
+        result = self.db.execute(
+            update(JobMandate)
+            .where(
+                JobMandate.mandate_id == mandate_id,
+                JobMandate.user_id == self.user_id
+            )
+            .values(
+                status=MandateStatus.COMPLETED,
+                completed_at=func.utc_timestamp(),
+                summary=func.coalesce(summary or None, JobMandate.summary),
+                section_statuses=ALL_SECTIONS_COMPLETED
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        # The UPDATE bypassed the cached instance
+        self.invalidate_mandate_cache(mandate_id)
+        if not result.rowcount:
+            return None
+        logger.info(f"Completed job mandate {mandate_id}")
+        return self.get_mandate(mandate_id)
+
+    def _complete_mandate_nocommit(self, mandate: JobMandate, summary: Optional[str] = None) -> None:
+        """Apply completion to a loaded mandate without committing."""
+        mandate.status = MandateStatus.COMPLETED
+        mandate.completed_at = func.utc_timestamp()
+        if summary:
+            mandate.summary = summary
+        # Mark all sections as completed
+        mandate.section_statuses = dict(ALL_SECTIONS_COMPLETED)
 
     def archive_mandate(self, mandate_id: int) -> Optional[JobMandate]:
         """Archive a mandate."""
         mandate = self.get_mandate(mandate_id)
         if mandate:
             mandate.status = MandateStatus.ARCHIVED
-            mandate.updated_at = datetime.utcnow()
             self.db.commit()
             self.db.refresh(mandate)
         return mandate
@@ -139,15 +173,40 @@ class JobMandateService:
         status: MandateSectionStatus
     ) -> Optional[JobMandate]:
         """Update the status of a section."""
-        mandate = self.get_mandate(mandate_id)
-        if mandate:
-            statuses = dict(mandate.section_statuses) if mandate.section_statuses else {}
-            statuses[section.value] = status.value
-            mandate.section_statuses = statuses
-            mandate.updated_at = datetime.utcnow()
-            self.db.commit()
-            self.db.refresh(mandate)
-        return mandate
+        # JSON_SET rewrites only the one key server-side instead of the whole blob;
+        # it returns NULL on a NULL document, so start from {} when the column is unset
+        result = self.db.execute(
+            update(JobMandate)
+            .where(
+                JobMandate.mandate_id == mandate_id,
+                JobMandate.user_id == self.user_id
+            )
+            .values(
+                section_statuses=func.json_set(
+                    func.coalesce(JobMandate.section_statuses, func.json_object()),
+                    f"$.{section.value}",
+                    status.value
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        # The UPDATE bypassed the cached instance
+        self.invalidate_mandate_cache(mandate_id)
+        if not result.rowcount:
+            return None
+        return self.get_mandate(mandate_id)
+
+    def _update_section_status_nocommit(
+        self,
+        mandate: JobMandate,
+        section: MandateSectionType,
+        status: MandateSectionStatus
+    ) -> None:
+        """Apply a section status change to a loaded mandate without committing."""
+        statuses = dict(mandate.section_statuses) if mandate.section_statuses else {}
+        statuses[section.value] = status.value
+        mandate.section_statuses = statuses
 
     def advance_to_next_section(self, mandate_id: int) -> Optional[JobMandate]:
         """
@@ -158,27 +217,20 @@ class JobMandateService:
         if not mandate:
             return None
 
-        section_order = [
-            MandateSectionType.ENERGIZES,
-            MandateSectionType.STRENGTHS,
-            MandateSectionType.MUST_HAVES,
-            MandateSectionType.DEAL_BREAKERS,
-        ]
-
-        current_idx = section_order.index(mandate.current_section)
+        current_idx = SECTION_INDEX[mandate.current_section]
 
         # Mark current section as completed
-        self.update_section_status(mandate_id, mandate.current_section, MandateSectionStatus.COMPLETED)
+        self._update_section_status_nocommit(mandate, mandate.current_section, MandateSectionStatus.COMPLETED)
 
         # Move to next section if there is one
-        if current_idx < len(section_order) - 1:
-            next_section = section_order[current_idx + 1]
+        if current_idx < len(SECTION_ORDER) - 1:
+            next_section = SECTION_ORDER[current_idx + 1]
             mandate.current_section = next_section
-            self.update_section_status(mandate_id, next_section, MandateSectionStatus.IN_PROGRESS)
+            self._update_section_status_nocommit(mandate, next_section, MandateSectionStatus.IN_PROGRESS)
             logger.info(f"Mandate {mandate_id} advanced to section {next_section.value}")
         else:
             # All sections complete - mark mandate as completed
-            self.complete_mandate(mandate_id)
+            self._complete_mandate_nocommit(mandate)
             logger.info(f"Mandate {mandate_id} all sections complete")
 
         self.db.commit()
@@ -212,7 +264,8 @@ class JobMandateService:
             source_message_id=source_message_id
         )
         self.db.add(item)
-        mandate.updated_at = datetime.utcnow()
+        # Nothing else changes on the mandate, so touch updated_at explicitly
+        mandate.updated_at = func.utc_timestamp()
         self.db.commit()
         self.db.refresh(item)
         logger.debug(f"Added item to mandate {mandate_id} section {section.value}: {content[:50]}...")
@@ -227,27 +280,42 @@ class JobMandateService:
     ) -> List[JobMandateItem]:
         """Add multiple items to a mandate section at once."""
         mandate = self.get_mandate(mandate_id)
-        if not mandate:
+        if not mandate or not insights:
             return []
 
-        items = []
-        for insight in insights:
-            item = JobMandateItem(
-                mandate_id=mandate_id,
-                section=section,
-                content=insight.content,
-                category=insight.category,
-                source=MandateItemSource.EXTRACTED,
-                source_message_id=source_message_id
-            )
-            self.db.add(item)
-            items.append(item)
+        now = datetime.utcnow()
+        rows = [
+            {
+                "mandate_id": mandate_id,
+                "section": section,
+                "content": insight.content,
+                "category": insight.category,
+                "source": MandateItemSource.EXTRACTED,
+                "source_message_id": source_message_id,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for insight in insights
+        ]
 
-        mandate.updated_at = datetime.utcnow()
+        # One multi-row INSERT ... VALUES statement (a single round trip)
+        result = self.db.execute(insert(JobMandateItem).values(rows))
+        # MySQL has no RETURNING. lastrowid is LAST_INSERT_ID(), the id of the first
+        # row, and InnoDB allocates a simple multi-row INSERT's ids consecutively
+        # (auto_increment_increment = 1), so the new ids are first_id .. first_id + n - 1
+        first_id = result.lastrowid
+        mandate.updated_at = func.utc_timestamp()
         self.db.commit()
 
-        for item in items:
-            self.db.refresh(item)
+        items = self.db.query(JobMandateItem).filter(
+            JobMandateItem.mandate_id == mandate_id,
+            JobMandateItem.item_id.between(first_id, first_id + len(rows) - 1)
+        ).order_by(JobMandateItem.item_id).all()
+        if len(items) != len(rows):
+            logger.error(
+                f"Bulk insert into mandate {mandate_id} returned {len(items)}/{len(rows)} rows "
+                f"for ids starting at {first_id}; auto-increment ids were not consecutive"
+            )
 
         logger.info(f"Added {len(items)} items to mandate {mandate_id} section {section.value}")
         return items
@@ -266,84 +334,114 @@ class JobMandateService:
         category: Optional[str] = None
     ) -> Optional[JobMandateItem]:
         """Update an existing item."""
-        item = self.db.query(JobMandateItem).filter(JobMandateItem.item_id == item_id).first()
+        item = self._get_owned_item(item_id)
         if not item:
             return None
 
-        # Verify ownership
-        mandate = self.get_mandate(item.mandate_id)
-        if not mandate:
-            return None
-
         if content is not None:
             item.content = content
             item.source = MandateItemSource.USER_EDITED
         if category is not None:
             item.category = category
 
-        item.updated_at = datetime.utcnow()
         self.db.commit()
         self.db.refresh(item)
         return item
 
     def delete_item(self, item_id: int) -> bool:
         """Delete an item."""
-        item = self.db.query(JobMandateItem).filter(JobMandateItem.item_id == item_id).first()
+        item = self._get_owned_item(item_id)
         if not item:
             return False
 
-        # Verify ownership
-        mandate = self.get_mandate(item.mandate_id)
-        if not mandate:
-            return False
-
         self.db.delete(item)
         self.db.commit()
         return True
 
+    def _get_owned_item(self, item_id: int) -> Optional[JobMandateItem]:
+        """Get an item, verifying ownership through its mandate in the same query."""
+        return self.db.query(JobMandateItem).join(JobMandate).filter(
+            JobMandateItem.item_id == item_id,
+            JobMandate.user_id == self.user_id
+        ).first()
+
     # =========================================================================
     # Interview State
     # =========================================================================
 
     def get_interview_state(self, mandate_id: int) -> Optional[InterviewState]:
         """Get the current interview state for LLM context."""
-        mandate = self.get_mandate(mandate_id)
-        if not mandate:
+        # One LEFT JOIN fetches the mandate's progress and all of its items as
+        # plain column rows (no ORM instances, one round trip)
+        rows = self.db.execute(
+            select(
+                JobMandate.current_section,
+                JobMandate.section_statuses,
+                JobMandateItem.section,
+                JobMandateItem.item_id,
+                JobMandateItem.content,
+                JobMandateItem.category,
+                JobMandateItem.source,
+                JobMandateItem.source_message_id,
+                JobMandateItem.created_at,
+                JobMandateItem.updated_at,
+            )
+            .select_from(JobMandate)
+            .outerjoin(JobMandateItem, JobMandateItem.mandate_id == JobMandate.mandate_id)
+            .where(
+                JobMandate.mandate_id == mandate_id,
+                JobMandate.user_id == self.user_id
+            )
+            .order_by(JobMandateItem.section, JobMandateItem.created_at)
+        ).all()
+        if not rows:
             return None
 
-        items = self.get_items(mandate_id)
-
-        # Build sections dict
-        sections = {}
-        for section_type in MandateSectionType:
-            section_items = [item for item in items if item.section == section_type]
-            status_str = mandate.section_statuses.get(section_type.value, "not_started")
+        current_section, section_statuses = rows[0][0], rows[0][1] or {}
 
-            sections[section_type] = MandateSection(
+        # Seed every section so empty ones are still present
+        sections = {
+            section_type: InterviewSection(
                 section_type=section_type,
-                status=MandateSectionStatus(status_str),
-                items=[
-                    MandateItemSchema(
-                        id=item.item_id,
-                        content=item.content,
-                        category=item.category,
-                        source=item.source,
-                        source_message_id=item.source_message_id,
-                        created_at=item.created_at,
-                        updated_at=item.updated_at
-                    )
-                    for item in section_items
-                ]
+                status=MandateSectionStatus(
+                    section_statuses.get(section_type.value, "not_started")
+                ),
+                items=[]
             )
+            for section_type in MandateSectionType
+        }
+
+        # Rows arrive ordered by section, so one grouped pass fills the buckets.
+        # A mandate without items yields a single row with NULL item columns.
+        for section_type, section_rows in groupby(rows, key=itemgetter(2)):
+            if section_type is None:
+                continue
+            sections[section_type].items = [
+                InterviewItem(
+                    id=item_id,
+                    content=content,
+                    category=category,
+                    source=source,
+                    source_message_id=source_message_id,
+                    created_at=created_at,
+                    updated_at=updated_at
+                )
+                for _, _, _, item_id, content, category, source, source_message_id, created_at, updated_at in section_rows
+            ]
 
         return InterviewState(
-            current_section=mandate.current_section,
+            current_section=current_section,
             sections=sections
         )
 
-    def get_section_item_count(self, mandate_id: int, section: MandateSectionType) -> int:
-        """Get the number of items in a section."""
-        return self.db.query(JobMandateItem).filter(
-            JobMandateItem.mandate_id == mandate_id,
-            JobMandateItem.section == section
-        ).count()
+    def item_to_schema(self, item: JobMandateItem) -> InterviewItem:
+        """Convert a mandate item row to its schema representation."""
+        return InterviewItem(
+            id=item.item_id,
+            content=item.content,
+            category=item.category,
+            source=item.source,
+            source_message_id=item.source_message_id,
+            created_at=item.created_at,
+            updated_at=item.updated_at
+        )
@@ -9,12 +9,43 @@ import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any, Optional, TypedDict
+from typing import Dict, Any, List, Optional, TypedDict
+from urllib.parse import urlparse
 
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Route, TimeoutError as PlaywrightTimeout
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_VIEWPORT = {'width': 1920, 'height': 1080}
+# Content selectors for known JS-heavy hosts. When one appears the page is
+# considered ready and the fixed post-load wait is skipped.
+HOST_READY_SELECTORS: Dict[str, str] = {
+    'yelp.com': '#reviews',
+    'google.com': 'div[role="main"]',
+    'healthgrades.com': 'main',
+}
+HOST_SELECTOR_TIMEOUT_MS = 10000
+
+# Subresources that never affect extracted text. Stylesheets are kept because
+# innerText depends on CSS visibility (hidden menus/modals would leak in).
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+
+# Extract text in the page from the main content root (falling back to body),
+# compacting whitespace and capping length before it crosses the CDP boundary.
+# Single newlines are kept so paragraph/review boundaries survive.
+EXTRACT_TEXT_JS = """(maxChars) => {
+    const root = document.querySelector('main, [role="main"], article') || document.body;
+    if (!root) return '';
+    return root.innerText
+        .replace(/[ \\t\\f\\v\\u00a0]+/g, ' ')
+        .replace(/\\s*\\n\\s*/g, '\\n')
+        .trim()
+        .slice(0, maxChars);
+}"""
+MAX_CONTENT_CHARS = 200000
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
 
 @dataclass
 class JSWebpage:
@@ -36,6 +67,15 @@ class JSWebRetrievalResult(TypedDict):
     timestamp: str
 
 
+def _ready_selector_for(url: str) -> Optional[str]:
+    """Look up the ready selector registered for a URL's host, if any."""
+    host = urlparse(url).netloc.lower()
+    for domain, selector in HOST_READY_SELECTORS.items():
+        if host == domain or host.endswith('.' + domain):
+            return selector
+    return None
+
+
 class JSWebRetrievalService:
     """
     Service for retrieving web pages that require JavaScript rendering.
@@ -48,11 +88,18 @@ class JSWebRetrievalService:
     - Sites with anti-bot measures that check for JS execution
     """
 
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 4):
         self.default_timeout = 30000  # 30 seconds
         self.default_wait_after_load = 2000  # 2 seconds for dynamic content
         self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
         self._playwright = None
+        # Bound concurrent navigations and keep idle pages around for reuse
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._page_pool: List[Page] = []
+        self._launch_lock = asyncio.Lock()
+        # Pages currently fetching with block_resources=False
+        self._unblocked_pages: set = set()
 
     async def _ensure_browser(self) -> Browser:
         """Ensure browser is launched, reuse if already running."""
@@ -66,11 +113,66 @@ class JSWebRetrievalService:
                     '--no-sandbox',
                 ]
             )
+            self._context = None
             logger.info("Launched Playwright browser")
         return self._browser
 
+    async def _ensure_context(self) -> BrowserContext:
+        """Ensure a shared browser context exists so pages reuse connections and cache."""
+        # Concurrent fetches must not race to launch separate browsers
+        async with self._launch_lock:
+            browser = await self._ensure_browser()
+            if self._context is None:
+                self._context = await browser.new_context(
+                    viewport=DEFAULT_VIEWPORT,
+                    user_agent=DEFAULT_USER_AGENT
+                )
+                await self._context.route('**/*', self._route_request)
+            return self._context
+
+    async def _route_request(self, route: Route) -> None:
+        """Abort image/media/font requests unless the page opted out of blocking."""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES:
+            try:
+                page = request.frame.page
+            except Exception:
+                page = None
+            if page not in self._unblocked_pages:
+                await route.abort()
+                return
+        await route.continue_()
+
+    async def _acquire_page(self) -> Page:
+        """Take an idle page from the pool, or open a new one."""
+        context = await self._ensure_context()
+        while self._page_pool:
+            page = self._page_pool.pop()
+            if not page.is_closed():
+                return page
+        return await context.new_page()
+
+    async def _release_page(self, page: Page, reusable: bool) -> None:
+        """Return a page to the pool after blanking it, or close it."""
+        if reusable and not page.is_closed():
+            try:
+                await page.goto('about:blank')
+                self._page_pool.append(page)
+                return
+            except Exception as e:
+                logger.debug(f"Discarding page that failed to reset: {e}")
+        if not page.is_closed():
+            await page.close()
+
     async def close(self):
         """Close the browser and cleanup resources."""
+        for page in self._page_pool:
+            if not page.is_closed():
+                await page.close()
+        self._page_pool.clear()
+        if self._context:
+            await self._context.close()
+            self._context = None
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -85,7 +187,9 @@ class JSWebRetrievalService:
         timeout: int = None,
         wait_after_load: int = None,
         wait_for_selector: Optional[str] = None,
-        extract_html: bool = False
+        extract_html: bool = False,
+        block_resources: bool = True,
+        max_chars: int = MAX_CONTENT_CHARS
     ) -> JSWebRetrievalResult:
         """
         Retrieve a webpage with full JavaScript rendering.
@@ -96,6 +200,8 @@ class JSWebRetrievalService:
             wait_after_load: Additional time to wait after load for dynamic content (ms)
             wait_for_selector: Optional CSS selector to wait for before considering page ready
             extract_html: Whether to include raw HTML in result
+            block_resources: Skip downloading images, media and fonts
+            max_chars: Cap on extracted text length, applied inside the page
 
         Returns:
             JSWebRetrievalResult with rendered page content
@@ -106,41 +212,63 @@ class JSWebRetrievalService:
         timeout = timeout or self.default_timeout
         wait_after_load = wait_after_load or self.default_wait_after_load
 
-        browser = await self._ensure_browser()
+        async with self._semaphore:
+            return await self._retrieve_with_pooled_page(
+                url, timeout, wait_after_load, wait_for_selector, extract_html, block_resources, max_chars
+            )
+
+    async def _retrieve_with_pooled_page(
+        self,
+        url: str,
+        timeout: int,
+        wait_after_load: int,
+        wait_for_selector: Optional[str],
+        extract_html: bool,
+        block_resources: bool,
+        max_chars: int
+    ) -> JSWebRetrievalResult:
+        """Fetch a page using a pooled Page; caller holds the semaphore."""
         page: Optional[Page] = None
+        reusable = False
 
         start_time = datetime.utcnow()
 
         try:
-            # Create new page with realistic viewport and user agent
-            page = await browser.new_page(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
+            page = await self._acquire_page()
+            if not block_resources:
+                self._unblocked_pages.add(page)
+
+            # Registry selectors are best-effort, so don't let a stale one eat the whole timeout
+            selector_timeout = timeout
+            if not wait_for_selector:
+                wait_for_selector = _ready_selector_for(url)
+                selector_timeout = min(timeout, HOST_SELECTOR_TIMEOUT_MS)
 
-            # Navigate to URL
+            # Navigate to URL; don't wait for trackers/XHRs to go quiet
             response = await page.goto(
                 url,
-                wait_until='networkidle',
+                wait_until='domcontentloaded',
                 timeout=timeout
             )
 
             status_code = response.status if response else 0
 
             # Wait for specific selector if provided
+            selector_found = False
             if wait_for_selector:
                 try:
-                    await page.wait_for_selector(wait_for_selector, timeout=timeout)
+                    await page.wait_for_selector(wait_for_selector, timeout=selector_timeout)
+                    selector_found = True
                 except PlaywrightTimeout:
                     logger.warning(f"Selector '{wait_for_selector}' not found within timeout")
 
-            # Additional wait for dynamic content
-            if wait_after_load > 0:
+            # Additional wait for dynamic content, unless the content is already there
+            if wait_after_load > 0 and not selector_found:
                 await asyncio.sleep(wait_after_load / 1000)
 
             # Extract content
             title = await page.title()
-            content = await page.inner_text('body')
+            content = await page.evaluate(EXTRACT_TEXT_JS, max_chars)
 
             html = None
             if extract_html:
@@ -184,6 +312,7 @@ class JSWebRetrievalService:
                 }
             )
 
+            reusable = True
             return JSWebRetrievalResult(
                 webpage=webpage,
                 status_code=status_code,
@@ -198,7 +327,8 @@ class JSWebRetrievalService:
             raise Exception(f"Failed to fetch page: {str(e)}")
         finally:
             if page:
-                await page.close()
+                self._unblocked_pages.discard(page)
+                await self._release_page(page, reusable)
 
 
 # Convenience function for one-off fetches
@@ -206,7 +336,8 @@ async def fetch_with_js(
     url: str,
     timeout: int = 30000,
     wait_after_load: int = 2000,
-    wait_for_selector: Optional[str] = None
+    wait_for_selector: Optional[str] = None,
+    max_chars: int = MAX_CONTENT_CHARS
 ) -> JSWebRetrievalResult:
     """
     Convenience function for one-off JS-rendered page fetches.
@@ -220,7 +351,8 @@ async def fetch_with_js(
             url=url,
             timeout=timeout,
             wait_after_load=wait_after_load,
-            wait_for_selector=wait_for_selector
+            wait_for_selector=wait_for_selector,
+            max_chars=max_chars
         )
     finally:
         await service.close()
@@ -4,8 +4,9 @@ Profile Service
 Handles user profile data access and formatting.
 """
 
-from typing import Optional, Dict, Any
-from sqlalchemy.orm import Session
+from typing import Optional, Dict, Any, Tuple
+from functools import lru_cache
+from sqlalchemy.orm import Session, joinedload
 import logging
 
 from models import User, UserProfile
@@ -13,16 +14,53 @@ from models import User, UserProfile
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _format_profile_prompt(
+    full_name: Optional[str],
+    display_name: Optional[str],
+    bio: Optional[str],
+    preferences: Tuple[Tuple[str, str], ...]
+) -> str:
+    """Build the profile prompt section; cached on the profile's contents."""
+    profile_parts = []
+
+    # Basic user info
+    if full_name:
+        profile_parts.append(f"- Name: {full_name}")
+
+    # Profile-specific info
+    if display_name:
+        profile_parts.append(f"- Display name: {display_name}")
+    if bio:
+        profile_parts.append(f"- Bio: {bio}")
+
+    # Include any custom preferences
+    for key, value in preferences:
+        # Format key nicely (e.g., "timezone" -> "Timezone")
+        formatted_key = key.replace("_", " ").title()
+        profile_parts.append(f"- {formatted_key}: {value}")
+
+    if not profile_parts:
+        return ""
+
+    return "## User Profile\n" + "\n".join(profile_parts)
+
+
 class ProfileService:
     """Service for managing user profile information."""
 
     def __init__(self, db: Session, user_id: int):
         self.db = db
         self.user_id = user_id
+        self._user: Optional[User] = None
 
     def get_user_with_profile(self) -> Optional[User]:
-        """Get user with their profile loaded."""
-        return self.db.query(User).filter(User.user_id == self.user_id).first()
+        """Get user with their profile loaded (cached for this service instance)."""
+        if self._user is None:
+            self._user = self.db.query(User).options(
+                joinedload(User.profile)
+            ).filter(User.user_id == self.user_id).first()
+        return self._user
 
     def get_profile(self) -> Optional[UserProfile]:
         """Get user's profile."""
@@ -39,32 +77,19 @@ class ProfileService:
         if not user:
             return ""
 
-        profile_parts = []
-
-        # Basic user info
-        if user.full_name:
-            profile_parts.append(f"- Name: {user.full_name}")
-
-        # Profile-specific info
-        if user.profile:
-            if user.profile.display_name:
-                profile_parts.append(f"- Display name: {user.profile.display_name}")
-            if user.profile.bio:
-                profile_parts.append(f"- Bio: {user.profile.bio}")
-
-            # Include any custom preferences
-            if user.profile.preferences:
-                prefs = user.profile.preferences
-                if isinstance(prefs, dict):
-                    for key, value in prefs.items():
-                        # Format key nicely (e.g., "timezone" -> "Timezone")
-                        formatted_key = key.replace("_", " ").title()
-                        profile_parts.append(f"- {formatted_key}: {value}")
-
-        if not profile_parts:
-            return ""
+        profile = user.profile
+        prefs = profile.preferences if profile else None
+        frozen_prefs = (
+            tuple((key, str(value)) for key, value in prefs.items())
+            if isinstance(prefs, dict) else ()
+        )
 
-        return "## User Profile\n" + "\n".join(profile_parts)
+        return _format_profile_prompt(
+            user.full_name,
+            profile.display_name if profile else None,
+            profile.bio if profile else None,
+            frozen_prefs
+        )
 
     def update_preferences(self, preferences: Dict[str, Any]) -> UserProfile:
         """Update user's preferences (merges with existing)."""
@@ -84,6 +109,7 @@ class ProfileService:
 
         self.db.commit()
         self.db.refresh(user.profile)
+        self._user = None
         return user.profile
 
     def set_preference(self, key: str, value: Any) -> UserProfile:
@@ -48,9 +48,16 @@ class WebRetrievalService:
         url: str,
         extract_text_only: bool = True,
         timeout: int = None,
-        user_agent: str = None
+        user_agent: str = None,
+        max_bytes: Optional[int] = None,
+        max_chars: Optional[int] = None
     ) -> WebRetrievalServiceResult:
-        """Retrieve and parse a webpage"""
+        """
+        Retrieve and parse a webpage
+
+        max_bytes caps how much of the response body is downloaded and parsed;
+        max_chars caps the length of the extracted text content.
+        """
         if not url:
             raise ValueError("URL is required")
 
@@ -77,7 +84,7 @@ class WebRetrievalService:
                     end_time = datetime.utcnow()
                     response_time_ms = int((end_time - start_time).total_seconds() * 1000)
 
-                    content = await response.read()
+                    content = await self._read_body(response, max_bytes)
 
                     webpage = await self._parse_webpage(
                         url=str(response.url),
@@ -86,6 +93,8 @@ class WebRetrievalService:
                         headers=dict(response.headers),
                         extract_text_only=extract_text_only
                     )
+                    if max_chars is not None and len(webpage.content) > max_chars:
+                        webpage.content = webpage.content[:max_chars]
 
                     return WebRetrievalServiceResult(
                         webpage=webpage,
@@ -102,6 +111,20 @@ class WebRetrievalService:
             logger.error(f"Error retrieving webpage {url}: {str(e)}")
             raise Exception(f"Failed to retrieve webpage: {str(e)}")
 
+    async def _read_body(self, response: aiohttp.ClientResponse, max_bytes: Optional[int]) -> bytes:
+        """Read the response body, stopping once max_bytes have arrived."""
+        if max_bytes is None:
+            return await response.read()
+
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(65536):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                break
+        return b''.join(chunks)[:max_bytes]
+
     async def _parse_webpage(
         self,
         url: str,
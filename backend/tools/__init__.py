@@ -10,6 +10,7 @@ from .registry import (
     ToolResult,
     ToolProgress,
     register_tool,
+    register_tools,
     get_tool,
     get_all_tools,
     get_tools_by_category,
@@ -30,6 +31,7 @@ __all__ = [
     'ToolResult',
     'ToolProgress',
     'register_tool',
+    'register_tools',
     'get_tool',
     'get_all_tools',
     'get_tools_by_category',
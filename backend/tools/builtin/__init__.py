@@ -13,7 +13,7 @@ from .map_reduce import register_map_reduce_tools
 from .workflow_builder import register_workflow_builder_tools
 from .smart_search import register_smart_search_tools
 from .pubmed_search import register_pubmed_search_tools
-from .pubmed_smart_search import register_pubmed_smart_search_tools
+from . import pubmed_smart_search  # Registers its tool on import
 from .arxiv_search import register_arxiv_search_tools
 from .assets import register_asset_tools
 from .gmail import register_gmail_tools
@@ -33,7 +33,6 @@ def register_all_builtin_tools():
     register_workflow_builder_tools()
     register_smart_search_tools()
     register_pubmed_search_tools()
-    register_pubmed_smart_search_tools()
     register_arxiv_search_tools()
     register_asset_tools()
     register_gmail_tools()
@@ -52,7 +51,6 @@ __all__ = [
     'register_workflow_builder_tools',
     'register_smart_search_tools',
     'register_pubmed_search_tools',
-    'register_pubmed_smart_search_tools',
     'register_arxiv_search_tools',
     'register_asset_tools',
     'register_gmail_tools',
@@ -8,11 +8,32 @@ import logging
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
 
-from tools.registry import ToolConfig, ToolResult, register_tool
-from models import AgentLifecycle, AgentStatus
+from tools.registry import ToolConfig, ToolResult, register_tools
+from models import AgentLifecycle, AgentStatus, AgentRunStatus
 
 logger = logging.getLogger(__name__)
 
+_LIFECYCLE_MAP = {m.value: m for m in AgentLifecycle}
+
+_AGENT_STATUS_ICONS = {
+    AgentStatus.ACTIVE: "🟢",
+    AgentStatus.PAUSED: "🟡",
+    AgentStatus.COMPLETED: "⚪",
+    AgentStatus.FAILED: "🔴"
+}
+
+_RUN_STATUS_ICONS = {
+    AgentRunStatus.COMPLETED: "✅",
+    AgentRunStatus.RUNNING: "🔄",
+    AgentRunStatus.FAILED: "❌",
+    AgentRunStatus.PENDING: "⏳"
+}
+
+
+def _truncate(s: str, n: int) -> str:
+    """Shorten s to n chars with an ellipsis; short strings are returned as-is."""
+    return s if len(s) <= n else s[:n] + "..."
+
 
 def execute_list_agents(
     params: Dict[str, Any],
@@ -34,23 +55,18 @@ def execute_list_agents(
             data={"agents": [], "count": 0}
         )
 
-    formatted = f"**Found {len(agents)} autonomous agents:**\n\n"
+    parts = [f"**Found {len(agents)} autonomous agents:**\n\n"]
     agent_list = []
 
     for agent in agents:
-        status_icon = {
-            "active": "🟢",
-            "paused": "🟡",
-            "completed": "⚪",
-            "failed": "🔴"
-        }.get(agent.status.value, "⚪")
-
-        formatted += f"{status_icon} **{agent.name}** (ID: {agent.agent_id})\n"
-        formatted += f"   Lifecycle: {agent.lifecycle.value} | Status: {agent.status.value}\n"
-        formatted += f"   Runs: {agent.total_runs} | Assets: {agent.total_assets_created}\n"
+        status_icon = _AGENT_STATUS_ICONS.get(agent.status, "⚪")
+
+        parts.append(f"{status_icon} **{agent.name}** (ID: {agent.agent_id})\n")
+        parts.append(f"   Lifecycle: {agent.lifecycle.value} | Status: {agent.status.value}\n")
+        parts.append(f"   Runs: {agent.total_runs} | Assets: {agent.total_assets_created}\n")
         if agent.description:
-            formatted += f"   {agent.description[:100]}\n"
-        formatted += "\n"
+            parts.append(f"   {agent.description[:100]}\n")
+        parts.append("\n")
 
         agent_list.append({
             "agent_id": agent.agent_id,
@@ -63,7 +79,7 @@ def execute_list_agents(
             "tools": agent.tools or []
         })
 
-    return ToolResult(text=formatted, data={"agents": agent_list, "count": len(agents)})
+    return ToolResult(text="".join(parts), data={"agents": agent_list, "count": len(agents)})
 
 
 def execute_get_agent(
@@ -83,21 +99,12 @@ def execute_get_agent(
 
     service = AutonomousAgentService(db, user_id)
 
-    agent = None
     if agent_id:
-        agent = service.get_agent(agent_id)
-    elif agent_name:
-        # Search by name
-        agents = service.list_agents()
-        for a in agents:
-            if a.name.lower() == agent_name.lower():
-                agent = a
-                break
-        if not agent:
-            for a in agents:
-                if agent_name.lower() in a.name.lower():
-                    agent = a
-                    break
+        # Agent and recent runs in one round-trip
+        agent, runs = service.get_agent_with_recent_runs(agent_id, runs_limit=5)
+    else:
+        agent = service.find_agent_by_name(agent_name)
+        runs = service.get_agent_runs(agent.agent_id, limit=5) if agent else []
 
     if not agent:
         return ToolResult(
@@ -105,34 +112,36 @@ def execute_get_agent(
             data={"success": False, "error": "not_found"}
         )
 
-    # Get recent runs
-    runs = service.get_agent_runs(agent.agent_id, limit=5)
-
-    formatted = f"**{agent.name}** (ID: {agent.agent_id})\n\n"
-    formatted += f"**Status:** {agent.status.value}\n"
-    formatted += f"**Lifecycle:** {agent.lifecycle.value}\n"
+    parts = [
+        f"**{agent.name}** (ID: {agent.agent_id})\n\n",
+        f"**Status:** {agent.status.value}\n",
+        f"**Lifecycle:** {agent.lifecycle.value}\n",
+    ]
     if agent.description:
-        formatted += f"**Description:** {agent.description}\n"
-    formatted += f"**Tools:** {', '.join(agent.tools) if agent.tools else 'None'}\n"
-    formatted += f"**Total Runs:** {agent.total_runs}\n"
-    formatted += f"**Assets Created:** {agent.total_assets_created}\n"
+        parts.append(f"**Description:** {agent.description}\n")
+    parts.append(f"**Tools:** {', '.join(agent.tools) if agent.tools else 'None'}\n")
+    parts.append(f"**Total Runs:** {agent.total_runs}\n")
+    parts.append(f"**Assets Created:** {agent.total_assets_created}\n")
 
     if agent.next_run_at:
-        formatted += f"**Next Run:** {agent.next_run_at}\n"
+        parts.append(f"**Next Run:** {agent.next_run_at}\n")
 
-    formatted += f"\n**Instructions:**\n```\n{agent.instructions[:500]}{'...' if len(agent.instructions) > 500 else ''}\n```\n"
+    parts.append(f"\n**Instructions:**\n```\n{_truncate(agent.instructions, 500)}\n```\n")
 
+    # One pass over the runs builds both the markdown lines and the data payload
+    recent_runs = []
     if runs:
-        formatted += f"\n**Recent Runs:**\n"
-        for run in runs[:5]:
-            status_icon = {"completed": "✅", "running": "🔄", "failed": "❌", "pending": "⏳"}.get(run.status.value, "•")
-            formatted += f"- {status_icon} Run #{run.run_id}: {run.status.value}"
-            if run.result_summary:
-                formatted += f" - {run.result_summary[:50]}..."
-            formatted += "\n"
+        parts.append("\n**Recent Runs:**\n")
+    for run in runs:
+        status = run.status.value
+        parts.append(f"- {_RUN_STATUS_ICONS.get(run.status, '•')} Run #{run.run_id}: {status}")
+        if run.result_summary:
+            parts.append(f" - {run.result_summary[:50]}...")
+        parts.append("\n")
+        recent_runs.append({"run_id": run.run_id, "status": status, "result_summary": run.result_summary})
 
     return ToolResult(
-        text=formatted,
+        text="".join(parts),
         data={
             "success": True,
             "agent": {
@@ -145,12 +154,9 @@ def execute_get_agent(
                 "tools": agent.tools or [],
                 "total_runs": agent.total_runs,
                 "total_assets_created": agent.total_assets_created,
-                "next_run_at": str(agent.next_run_at) if agent.next_run_at else None
+                "next_run_at": agent.next_run_at.isoformat() if agent.next_run_at else None
             },
-            "recent_runs": [
-                {"run_id": r.run_id, "status": r.status.value, "result_summary": r.result_summary}
-                for r in runs
-            ]
+            "recent_runs": recent_runs
         }
     )
 
@@ -174,10 +180,8 @@ def execute_create_agent(
     if not instructions:
         return ToolResult(text="Error: Agent instructions are required")
 
-    try:
-        AgentLifecycle(lifecycle)
-    except ValueError:
-        return ToolResult(text=f"Error: Invalid lifecycle '{lifecycle}'. Must be one of: one_shot, scheduled, monitor")
+    if lifecycle not in _LIFECYCLE_MAP:
+        return ToolResult(text=f"Error: Invalid lifecycle '{lifecycle}'. Must be one of: {', '.join(_LIFECYCLE_MAP)}")
 
     # Build the workspace payload for frontend approval
     workspace_payload = {
@@ -318,6 +322,8 @@ def execute_update_agent(
     if not agent:
         return ToolResult(text=f"Agent not found: {agent_id}", data={"success": False})
 
+    current_tools = agent.tools or []
+
     # Build the updated agent data (merge current with updates)
     agent_data = {
         "agent_id": agent_id,
@@ -325,7 +331,7 @@ def execute_update_agent(
         "description": params.get("description", agent.description),
         "instructions": params.get("instructions", agent.instructions),
         "lifecycle": agent.lifecycle.value,  # Can't change lifecycle
-        "tools": params.get("tools", agent.tools or []),
+        "tools": params.get("tools", current_tools),
         "monitor_interval_minutes": params.get("monitor_interval_minutes", agent.monitor_interval_minutes)
     }
 
@@ -337,7 +343,7 @@ def execute_update_agent(
         changes.append("description")
     if "instructions" in params and params["instructions"] != agent.instructions:
         changes.append("instructions")
-    if "tools" in params and params["tools"] != (agent.tools or []):
+    if "tools" in params and params["tools"] != current_tools:
         changes.append("tools")
     if "monitor_interval_minutes" in params and params["monitor_interval_minutes"] != agent.monitor_interval_minutes:
         changes.append("monitor_interval_minutes")
@@ -424,31 +430,31 @@ def execute_get_agent_runs(
             data={"success": True, "runs": [], "count": 0}
         )
 
-    formatted = f"**Runs for '{agent.name}'** ({len(runs)} shown)\n\n"
+    parts = [f"**Runs for '{agent.name}'** ({len(runs)} shown)\n\n"]
     run_list = []
 
     for run in runs:
-        status_icon = {"completed": "✅", "running": "🔄", "failed": "❌", "pending": "⏳"}.get(run.status.value, "•")
-        formatted += f"{status_icon} **Run #{run.run_id}** - {run.status.value}\n"
+        status_icon = _RUN_STATUS_ICONS.get(run.status, "•")
+        parts.append(f"{status_icon} **Run #{run.run_id}** - {run.status.value}\n")
         if run.started_at:
-            formatted += f"   Started: {run.started_at}\n"
+            parts.append(f"   Started: {run.started_at}\n")
         if run.result_summary:
-            formatted += f"   Result: {run.result_summary[:100]}...\n"
+            parts.append(f"   Result: {run.result_summary[:100]}...\n")
         if run.error:
-            formatted += f"   Error: {run.error[:100]}...\n"
-        formatted += "\n"
+            parts.append(f"   Error: {run.error[:100]}...\n")
+        parts.append("\n")
 
         run_list.append({
             "run_id": run.run_id,
             "status": run.status.value,
-            "started_at": str(run.started_at) if run.started_at else None,
-            "completed_at": str(run.completed_at) if run.completed_at else None,
+            "started_at": run.started_at.isoformat() if run.started_at else None,
+            "completed_at": run.completed_at.isoformat() if run.completed_at else None,
             "result_summary": run.result_summary,
             "error": run.error,
             "assets_created": run.assets_created
         })
 
-    return ToolResult(text=formatted, data={"success": True, "runs": run_list, "count": len(runs)})
+    return ToolResult(text="".join(parts), data={"success": True, "runs": run_list, "count": len(runs)})
 
 
 # Tool configurations
@@ -667,13 +673,16 @@ GET_AGENT_RUNS_TOOL = ToolConfig(
 
 def register_agent_tools():
     """Register all agent management tools."""
-    register_tool(LIST_AGENTS_TOOL)
-    register_tool(GET_AGENT_TOOL)
-    register_tool(CREATE_AGENT_TOOL)
-    register_tool(TRIGGER_AGENT_RUN_TOOL)
-    register_tool(PAUSE_AGENT_TOOL)
-    register_tool(RESUME_AGENT_TOOL)
-    register_tool(UPDATE_AGENT_TOOL)
-    register_tool(DELETE_AGENT_TOOL)
-    register_tool(GET_AGENT_RUNS_TOOL)
-    logger.info("Registered 9 agent management tools")
+    agent_tools = [
+        LIST_AGENTS_TOOL,
+        GET_AGENT_TOOL,
+        CREATE_AGENT_TOOL,
+        TRIGGER_AGENT_RUN_TOOL,
+        PAUSE_AGENT_TOOL,
+        RESUME_AGENT_TOOL,
+        UPDATE_AGENT_TOOL,
+        DELETE_AGENT_TOOL,
+        GET_AGENT_RUNS_TOOL,
+    ]
+    register_tools(agent_tools)
+    logger.info(f"Registered {len(agent_tools)} agent management tools")
@@ -8,26 +8,57 @@ Two modes:
 2. Web scraping mode (fallback): Orchestrated search/fetch/verify loop
 """
 
+import asyncio
+import atexit
+import functools
 import json
 import logging
+import re
 import time
 from dataclasses import dataclass, asdict
-from typing import Dict, Any, List, Optional, Literal, Generator
+from typing import Dict, Any, AsyncGenerator, Callable, Final, List, Optional, Literal, Generator, Union
 from urllib.parse import urlparse
 
+import orjson
+
+from tools.builtin.llm_cache import llm_cache, semantic_llm_cache
+from tools.executor import get_background_loop, submit_to_background_loop
+
 logger = logging.getLogger(__name__)
 
 # Configuration
 LLM_MODEL = "claude-sonnet-4-20250514"
+LLM_MAX_TOKENS = 1024
+LLM_MAX_RETRIES = 4  # SDK retries of 408/409/429/5xx and connection errors (honors retry-after)
 MAX_ITERATIONS = 5
+MAX_STALLED_ITERATIONS = 2  # Consecutive iterations re-proposing an already-tried URL
+MAX_TOTAL_SECONDS = 240  # Wall-clock budget for the scraping loop
 USE_SERPAPI = True  # Try SerpAPI first
+MAX_PAGE_CHARS = 12000  # Page text passed to the verify prompt
+MAX_FETCH_BYTES = 2_000_000  # Raw HTML downloaded for non-JS fetches
+VERIFY_CONTEXT_CHARS = 6000  # Page text kept for the verify prompt after relevance filtering
+VERIFY_HEAD_CHARS = 500  # Leading page text (title/header) always kept
+PREFETCH_TOP_K = 3  # Search results fetched speculatively while the LLM picks a candidate
+
+# Sites whose content is rendered client-side; matched by registrable domain
+_JS_DOMAINS: Final[frozenset] = frozenset({'yelp.com', 'google.com', 'healthgrades.com'})
+
+# search site: operator per source
+_SITE_OPERATORS: Final[Dict[str, str]] = {
+    "yelp": "site:yelp.com/biz",
+    "google": "site:google.com/maps OR site:maps.google.com",
+    "reddit": "site:reddit.com",
+}
+
+_JSON_BLOCK_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
 
 
 # =============================================================================
 # Data Structures
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """A single search result."""
     title: str
@@ -35,7 +66,7 @@ class SearchResult:
     snippet: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityCandidate:
     """A potential entity match suggested by the LLM."""
     name: str
@@ -44,7 +75,7 @@ class EntityCandidate:
     confidence: Literal["high", "medium", "low"]
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationStep:
     """A step in the verification process."""
     iteration: int
@@ -54,7 +85,7 @@ class VerificationStep:
     duration_ms: int
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     """Result of entity verification."""
     status: Literal["confirmed", "not_found", "ambiguous", "gave_up", "error"]
@@ -69,7 +100,8 @@ class VerificationResult:
 # LLM Prompts (structured, focused)
 # =============================================================================
 
-GUESS_PROMPT = """You are identifying a business from search results.
+def _guess_prompt(business_name: str, location: str, source: str, search_results: str) -> str:
+    return f"""You are identifying a business from search results.
 
     TARGET BUSINESS: "{business_name}" in "{location}"
     PLATFORM: {source}
@@ -99,7 +131,8 @@ GUESS_PROMPT = """You are identifying a business from search results.
     - If multiple good matches, pick the one with strongest signals
     - If none look right, say "none_match" and suggest a better search"""
 
-VERIFY_PROMPT = """You are verifying this is the correct business.
+def _verify_prompt(business_name: str, location: str, url: str, page_content: str) -> str:
+    return f"""You are verifying this is the correct business.
 
     TARGET BUSINESS: "{business_name}" in "{location}"
     EXPECTED URL: {url}
@@ -137,22 +170,60 @@ VERIFY_PROMPT = """You are verifying this is the correct business.
 # Core Functions
 # =============================================================================
 
-def _do_search(query: str, db, user_id: int, context: Dict) -> List[SearchResult]:
-    """Execute a search and return results."""
-    from services.search_service import SearchService
-    import asyncio
+# Long-lived service instances bound to the shared tool background loop, so HTTP
+# sessions, the Playwright browser and the Anthropic connection pool stay warm
+# across the search/fetch/LLM calls of a verification run.
+_search_service = None
+_web_service = None
+_js_service = None
+_llm_client = None
 
-    search_service = SearchService()
-    if not search_service.initialized:
-        search_service.initialize()
+# Upper bound on any single search/fetch/LLM call (seconds)
+ASYNC_CALL_TIMEOUT = 120
 
-    loop = asyncio.new_event_loop()
-    try:
-        result = loop.run_until_complete(
-            search_service.search(search_term=query, num_results=10)
-        )
-    finally:
-        loop.close()
+
+def _shutdown_js_service():
+    """Close the shared browser on interpreter exit."""
+    loop = get_background_loop()
+    if _js_service is not None and loop.is_running():
+        try:
+            asyncio.run_coroutine_threadsafe(_js_service.close(), loop).result(timeout=5)
+        except Exception as e:
+            logger.debug(f"Error closing shared browser: {e}")
+
+
+def _get_search_service():
+    global _search_service
+    if _search_service is None:
+        from services.search_service import SearchService
+        _search_service = SearchService()
+        _search_service.initialize()
+    return _search_service
+
+
+def _get_web_service():
+    global _web_service
+    if _web_service is None:
+        from services.web_retrieval_service import WebRetrievalService
+        _web_service = WebRetrievalService()
+    return _web_service
+
+
+def _get_js_service():
+    global _js_service
+    if _js_service is None:
+        from services.js_web_retrieval_service import JSWebRetrievalService
+        _js_service = JSWebRetrievalService()
+        atexit.register(_shutdown_js_service)
+    return _js_service
+
+
+async def _do_search(query: str) -> List[SearchResult]:
+    """Execute a search and return results."""
+    result = await asyncio.wait_for(
+        _get_search_service().search(search_term=query, num_results=10),
+        ASYNC_CALL_TIMEOUT
+    )
 
     results = []
     for r in result.get("search_results", []):
@@ -165,27 +236,18 @@ def _do_search(query: str, db, user_id: int, context: Dict) -> List[SearchResult
     return results
 
 
-def _run_async(coro):
-    """Run async code safely, handling Windows subprocess requirements."""
-    import asyncio
-    import sys
-
-    # On Windows, we need ProactorEventLoop for subprocess support (used by Playwright)
-    if sys.platform == 'win32':
-        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-
-    # Use asyncio.run() which properly manages the event loop
-    return asyncio.run(coro)
-
-
-def _do_fetch(url: str, needs_js: bool = False) -> tuple[str, bool]:
+async def _do_fetch(url: str, needs_js: bool = False) -> tuple[str, bool]:
     """Fetch a page and return (content, was_blocked)."""
+    # Ask the fetchers for one char past the limit so we can tell when truncation happened
+    fetch_chars = MAX_PAGE_CHARS + 1
+
     try:
         if needs_js:
-            from services.js_web_retrieval_service import fetch_with_js
-
-            result = _run_async(
-                fetch_with_js(url=url, timeout=45000, wait_after_load=3000)
+            result = await asyncio.wait_for(
+                _get_js_service().retrieve_webpage(
+                    url=url, timeout=45000, wait_after_load=3000, max_chars=fetch_chars
+                ),
+                ASYNC_CALL_TIMEOUT
             )
 
             webpage = result["webpage"]
@@ -194,91 +256,184 @@ def _do_fetch(url: str, needs_js: bool = False) -> tuple[str, bool]:
 
             if was_blocked:
                 return f"[BLOCKED: {webpage.metadata.get('block_reason', 'Unknown')}]", True
-
-            # Truncate for LLM
-            if len(content) > 12000:
-                content = content[:12000] + "\n\n[Content truncated]"
-
-            return content, False
         else:
-            from services.web_retrieval_service import WebRetrievalService
-
-            web_service = WebRetrievalService()
-            result = _run_async(
-                web_service.retrieve_webpage(url=url, extract_text_only=True)
+            result = await asyncio.wait_for(
+                _get_web_service().retrieve_webpage(
+                    url=url, extract_text_only=True, max_bytes=MAX_FETCH_BYTES, max_chars=fetch_chars
+                ),
+                ASYNC_CALL_TIMEOUT
             )
 
             content = result["webpage"].content
-            if len(content) > 12000:
-                content = content[:12000] + "\n\n[Content truncated]"
 
-            return content, False
+        # Truncate for LLM
+        if len(content) > MAX_PAGE_CHARS:
+            content = content[:MAX_PAGE_CHARS] + "\n\n[Content truncated]"
 
+        return content, False
+
+    except asyncio.CancelledError:
+        raise
     except Exception as e:
         logger.error(f"Fetch error for {url}: {e}")
         return f"[FETCH ERROR: {str(e)}]", True
 
 
-def _call_llm(prompt: str) -> str:
-    """Call the LLM and return its response."""
-    import anthropic
+def _cancel_prefetch(prefetch: Dict[str, asyncio.Task]) -> None:
+    """Cancel speculative fetches that were never consumed."""
+    for task in prefetch.values():
+        task.cancel()
+    prefetch.clear()
+
+
+def _get_llm_client():
+    """Lazily create the shared async Anthropic client (reuses its HTTP connection pool)."""
+    global _llm_client
+    if _llm_client is None:
+        import anthropic
+        _llm_client = anthropic.AsyncAnthropic(max_retries=LLM_MAX_RETRIES)
+    return _llm_client
+
 
-    client = anthropic.Anthropic()
-    response = client.messages.create(
+async def _embed(text: str) -> Optional[List[float]]:
+    """Embed a short key for the semantic cache; None if embeddings are unavailable."""
+    try:
+        from services.embedding_service import get_embedding_service
+        return await asyncio.to_thread(get_embedding_service().get_embedding, text)
+    except Exception as e:
+        logger.debug(f"Semantic cache disabled for this call: {e}")
+        return None
+
+
+async def _call_llm(
+    prompt: str,
+    semantic_scope: Optional[str] = None,
+    semantic_key: Optional[str] = None
+) -> str:
+    """
+    Call the LLM and return its response (temperature 0, so identical prompts are cached).
+
+    When semantic_scope/semantic_key are given, a near-duplicate key within the
+    same scope (e.g. the same URL) also reuses an earlier response.
+    """
+    cache_key = llm_cache.make_key(LLM_MODEL, LLM_MAX_TOKENS, prompt)
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    embedding = None
+    if semantic_scope and semantic_key:
+        embedding = await _embed(semantic_key)
+        if embedding is not None:
+            cached = semantic_llm_cache.lookup(semantic_scope, embedding)
+            if cached is not None:
+                return cached
+
+    response = await _get_llm_client().messages.create(
         model=LLM_MODEL,
-        max_tokens=1024,
+        max_tokens=LLM_MAX_TOKENS,
         temperature=0,
-        messages=[{"role": "user", "content": prompt}]
+        messages=[{"role": "user", "content": prompt}],
+        timeout=ASYNC_CALL_TIMEOUT
     )
 
-    return response.content[0].text
+    text = response.content[0].text
+    llm_cache.set(cache_key, text)
+    if embedding is not None:
+        semantic_llm_cache.add(semantic_scope, embedding, text)
+    return text
+
+
+def _extract_relevant(page_content: str, business_name: str, location: str) -> str:
+    """
+    Reduce page text to the parts that bear on identity for the verify prompt.
+
+    Keeps the page head plus the lines that mention the business name or
+    location, highest scoring first, in their original order.
+    """
+    if len(page_content) <= VERIFY_CONTEXT_CHARS:
+        return page_content
+
+    name = business_name.lower()
+    name_words = [w for w in re.findall(r'\w+', name) if len(w) > 3]
+    location_terms = [t.strip() for t in location.lower().split(',') if t.strip()]
+
+    head = page_content[:VERIFY_HEAD_CHARS]
+    blocks = [b for b in page_content[VERIFY_HEAD_CHARS:].split('\n') if b.strip()]
+
+    scored = []
+    for pos, block in enumerate(blocks):
+        text = block.lower()
+        score = (3 if name in text else 0) + sum(w in text for w in name_words) + sum(t in text for t in location_terms)
+        if score:
+            scored.append((score, pos))
+
+    budget = VERIFY_CONTEXT_CHARS - len(head)
+    keep = []
+    for _, pos in sorted(scored, key=lambda s: (-s[0], s[1])):
+        if len(blocks[pos]) + 1 > budget:
+            continue
+        keep.append(pos)
+        budget -= len(blocks[pos]) + 1
+
+    return "\n".join([head, *(blocks[pos] for pos in sorted(keep))])
 
 
 def _parse_json_response(text: str) -> Optional[Dict]:
     """Extract JSON from LLM response."""
-    import re
+    # Fast path: the prompts ask for bare JSON, which is the common case
+    stripped = text.strip()
+    if stripped.startswith('{'):
+        try:
+            return orjson.loads(stripped)
+        except orjson.JSONDecodeError:
+            pass
 
-    # Try code block first
-    json_match = re.search(r'```json\s*(.*?)\s*```', text, re.DOTALL)
+    # Fall back to a fenced ```json block
+    json_match = _JSON_BLOCK_RE.search(text)
     if json_match:
         try:
-            return json.loads(json_match.group(1))
-        except json.JSONDecodeError:
+            return orjson.loads(json_match.group(1))
+        except orjson.JSONDecodeError:
             pass
 
-    # Try raw JSON
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
+    # Last resort: the first JSON object embedded in prose
+    start = text.find('{')
+    while start != -1:
+        try:
+            value, _ = _JSON_DECODER.raw_decode(text, start)
+            if isinstance(value, dict):
+                return value
+        except json.JSONDecodeError:
+            pass
+        start = text.find('{', start + 1)
 
     return None
 
 
+@functools.lru_cache(maxsize=512)
 def _needs_js_rendering(url: str) -> bool:
     """Check if URL needs JavaScript rendering."""
-    parsed = urlparse(url)
-    domain = parsed.netloc.lower()
+    domain = (urlparse(url).hostname or '').lower()
+
+    # Match on the registrable domain so any subdomain (www., maps., m.) counts
+    labels = domain.rsplit('.', 2)
+    return '.'.join(labels[-2:]) in _JS_DOMAINS
 
-    js_domains = [
-        'yelp.com', 'www.yelp.com',
-        'google.com', 'www.google.com', 'maps.google.com',
-        'healthgrades.com', 'www.healthgrades.com',
-    ]
 
-    return any(domain.endswith(d) or domain == d for d in js_domains)
+def _url_key(url: str) -> str:
+    """Normalize a URL for seen-checks so cosmetic variants match."""
+    parts = urlparse(url.strip())
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    path = parts.path.rstrip('/')
+    return f"{host}{path}?{parts.query}" if parts.query else f"{host}{path}"
 
 
 def _get_site_operator(source: str) -> str:
     """Get the site: operator for a source."""
-    if source == "yelp":
-        return "site:yelp.com/biz"
-    elif source == "google":
-        return "site:google.com/maps OR site:maps.google.com"
-    elif source == "reddit":
-        return "site:reddit.com"
-    else:
-        return ""
+    return _SITE_OPERATORS.get(source.lower(), "")
 
 
 # =============================================================================
@@ -427,9 +582,33 @@ def verify_entity(
             # result is None means SerpAPI not available, fall back to web scraping
             logger.info("SerpAPI unavailable, falling back to web scraping")
 
-    # Fall back to web scraping workflow
+    # Fall back to web scraping workflow, driven step by step on the shared loop
     yield {"stage": "fallback", "message": "Using web scraping fallback", "iteration": 0}
 
+    scraping_gen = _verify_with_scraping(business_name, location, source)
+    try:
+        while True:
+            try:
+                progress = submit_to_background_loop(scraping_gen.__anext__()).result()
+            except StopAsyncIteration:
+                return None
+            if isinstance(progress, VerificationResult):
+                return progress
+            yield progress
+    finally:
+        submit_to_background_loop(scraping_gen.aclose()).result()
+
+
+async def _verify_with_scraping(
+    business_name: str,
+    location: str,
+    source: str
+) -> AsyncGenerator[Union[Dict[str, Any], VerificationResult], None]:
+    """
+    Web scraping verification loop: search, LLM guess, fetch, LLM verify.
+
+    Yields progress dicts; the final item yielded is the VerificationResult.
+    """
     start_time = time.time()
     steps: List[VerificationStep] = []
     iteration = 0
@@ -438,225 +617,268 @@ def verify_entity(
     search_query = f'{site_op} "{business_name}" {location}'
 
     verified_content = None  # Store verified page content
+    tried_urls: set = set()  # _url_key of every URL already fetched; never offered or fetched again
+    prefetch: Dict[str, asyncio.Task] = {}  # _url_key -> speculative _do_fetch task
+    stalled = 0  # Consecutive iterations whose candidate was already tried
+    stop_reason = f"Could not verify entity after {MAX_ITERATIONS} attempts"
 
-    while iteration < MAX_ITERATIONS:
-        iteration += 1
-        logger.info(f"Entity verification iteration {iteration}/{MAX_ITERATIONS}")
+    try:
+        while iteration < MAX_ITERATIONS:
+            if time.time() - start_time > MAX_TOTAL_SECONDS:
+                stop_reason = f"Could not verify entity within {MAX_TOTAL_SECONDS}s ({iteration} attempts)"
+                break
 
-        # === STEP 1: Search ===
-        yield {"stage": "searching", "message": f"Searching {source.upper()} [{iteration}]", "iteration": iteration}
+            iteration += 1
+            logger.info(f"Entity verification iteration {iteration}/{MAX_ITERATIONS}")
 
-        step_start = time.time()
-        search_results = _do_search(search_query, db, user_id, context)
-        step_duration = int((time.time() - step_start) * 1000)
+            # === STEP 1: Search ===
+            yield {"stage": "searching", "message": f"Searching {source.upper()} [{iteration}]", "iteration": iteration}
 
-        steps.append(VerificationStep(
-            iteration=iteration,
-            action="search",
-            input=search_query,
-            output=f"{len(search_results)} results",
-            duration_ms=step_duration
-        ))
-
-        if not search_results:
-            yield {"stage": "no_results", "message": f"No {source.upper()} results found, refining search", "iteration": iteration}
-            # LLM might suggest different search
-            search_query = f'{site_op} {business_name} {location.split(",")[0]}'
-            continue
+            step_start = time.time()
+            search_results = await _do_search(search_query)
+            step_duration = int((time.time() - step_start) * 1000)
 
-        # Format results for LLM
-        results_text = "\n".join([
-            f"{i+1}. {r.title}\n   URL: {r.url}\n   {r.snippet[:200]}"
-            for i, r in enumerate(search_results[:8])
-        ])
+            steps.append(VerificationStep(
+                iteration=iteration,
+                action="search",
+                input=search_query,
+                output=f"{len(search_results)} results",
+                duration_ms=step_duration
+            ))
 
-        # === STEP 2: Ask LLM for best guess ===
-        yield {"stage": "analyzing", "message": f"Found {len(search_results)} results, selecting best match", "iteration": iteration}
+            search_results = [r for r in search_results if _url_key(r.url) not in tried_urls]
 
-        guess_prompt = GUESS_PROMPT.format(
-            business_name=business_name,
-            location=location,
-            source=source.upper(),
-            search_results=results_text
-        )
+            if not search_results:
+                yield {"stage": "no_results", "message": f"No {source.upper()} results found, refining search", "iteration": iteration}
+                # LLM might suggest different search
+                search_query = f'{site_op} {business_name} {location.split(",")[0]}'
+                continue
 
-        step_start = time.time()
-        guess_response = _call_llm(guess_prompt)
-        step_duration = int((time.time() - step_start) * 1000)
+            # Format results for LLM
+            results_text = "\n".join([
+                f"{i+1}. {r.title}\n   URL: {r.url}\n   {r.snippet[:200]}"
+                for i, r in enumerate(search_results[:8])
+            ])
+
+            # Speculatively fetch the top results while the LLM picks one; the
+            # candidate is usually among them, taking its fetch off the critical path
+            _cancel_prefetch(prefetch)
+            for r in search_results[:PREFETCH_TOP_K]:
+                prefetch[_url_key(r.url)] = asyncio.create_task(_do_fetch(r.url, _needs_js_rendering(r.url)))
+
+            # === STEP 2: Ask LLM for best guess ===
+            yield {"stage": "analyzing", "message": f"Found {len(search_results)} results, selecting best match", "iteration": iteration}
+
+            guess_prompt = _guess_prompt(
+                business_name=business_name,
+                location=location,
+                source=source.upper(),
+                search_results=results_text
+            )
 
-        steps.append(VerificationStep(
-            iteration=iteration,
-            action="llm_guess",
-            input=f"{len(search_results)} results",
-            output=guess_response[:200],
-            duration_ms=step_duration
-        ))
+            step_start = time.time()
+            guess_response = await _call_llm(guess_prompt)
+            step_duration = int((time.time() - step_start) * 1000)
 
-        guess_data = _parse_json_response(guess_response)
-        if not guess_data:
-            logger.warning(f"Could not parse guess response: {guess_response[:200]}")
-            yield {"stage": "parse_error", "message": "Could not parse LLM response", "iteration": iteration}
-            # Try a different search
-            search_query = f'"{business_name}" {location} {source}'
-            continue
+            steps.append(VerificationStep(
+                iteration=iteration,
+                action="llm_guess",
+                input=f"{len(search_results)} results",
+                output=guess_response[:200],
+                duration_ms=step_duration
+            ))
 
-        if guess_data.get("decision") == "none_match":
-            alt_search = guess_data.get("alternative_search", "")
-            if alt_search:
-                yield {"stage": "no_match", "message": f"No exact match, trying different search", "iteration": iteration}
-                search_query = f'{site_op} {alt_search}'
+            guess_data = _parse_json_response(guess_response)
+            if not guess_data:
+                logger.warning(f"Could not parse guess response: {guess_response[:200]}")
+                yield {"stage": "parse_error", "message": "Could not parse LLM response", "iteration": iteration}
+                # Try a different search
+                search_query = f'"{business_name}" {location} {source}'
                 continue
-            else:
-                # Give up
-                total_duration = int((time.time() - start_time) * 1000)
-                return VerificationResult(
-                    status="not_found",
-                    entity=None,
-                    page_content=None,
-                    steps=steps,
-                    total_duration_ms=total_duration,
-                    message=f"Could not find {business_name} on {source.upper()}"
-                )
-
-        # We have a candidate
-        candidate_data = guess_data.get("candidate", {})
-        candidate = EntityCandidate(
-            name=candidate_data.get("name", business_name),
-            url=candidate_data.get("url", ""),
-            reason=candidate_data.get("reason", ""),
-            confidence=candidate_data.get("confidence", "low")
-        )
 
-        if not candidate.url:
-            yield {"stage": "no_url", "message": "No valid URL found, refining search", "iteration": iteration}
-            search_query = f'{site_op} "{business_name}" "{location}"'
-            continue
-
-        # === STEP 3: Fetch the page (with retry on block) ===
-        # Build list of URLs to try: primary candidate + alternatives from search results
-        urls_to_try = [candidate.url]
-        for r in search_results[1:5]:
-            if source in r.url.lower() and r.url not in urls_to_try:
-                urls_to_try.append(r.url)
+            if guess_data.get("decision") == "none_match":
+                alt_search = guess_data.get("alternative_search", "")
+                if alt_search:
+                    yield {"stage": "no_match", "message": f"No exact match, trying different search", "iteration": iteration}
+                    search_query = f'{site_op} {alt_search}'
+                    continue
+                else:
+                    # Give up
+                    total_duration = int((time.time() - start_time) * 1000)
+                    yield VerificationResult(
+                        status="not_found",
+                        entity=None,
+                        page_content=None,
+                        steps=steps,
+                        total_duration_ms=total_duration,
+                        message=f"Could not find {business_name} on {source.upper()}"
+                    )
+                    return
+
+            # We have a candidate
+            candidate_data = guess_data.get("candidate", {})
+            candidate = EntityCandidate(
+                name=candidate_data.get("name", business_name),
+                url=candidate_data.get("url", ""),
+                reason=candidate_data.get("reason", ""),
+                confidence=candidate_data.get("confidence", "low")
+            )
 
-        page_content = None
-        fetch_succeeded = False
+            if not candidate.url or _url_key(candidate.url) in tried_urls:
+                if candidate.url:
+                    stalled += 1
+                    if stalled >= MAX_STALLED_ITERATIONS:
+                        # The LLM keeps returning to pages it already rejected
+                        stop_reason = f"Could not verify entity: search kept returning already-checked pages ({iteration} attempts)"
+                        break
+                yield {"stage": "no_url", "message": "No valid URL found, refining search", "iteration": iteration}
+                search_query = f'{site_op} "{business_name}" "{location}"'
+                continue
 
-        for try_idx, try_url in enumerate(urls_to_try):
-            yield {"stage": "fetching", "message": f"Loading {source.upper()} page" + (f" (attempt {try_idx + 1})" if try_idx > 0 else ""), "iteration": iteration}
+            # === STEP 3: Fetch the page (with retry on block) ===
+            # Build list of URLs to try: primary candidate + alternatives from search results
+            urls_to_try = [candidate.url]
+            queued = {_url_key(candidate.url)}
+            for r in search_results[1:5]:
+                key = _url_key(r.url)
+                if source in r.url.lower() and key not in queued and key not in tried_urls:
+                    urls_to_try.append(r.url)
+                    queued.add(key)
+
+            page_content = None
+            fetch_succeeded = False
+
+            for try_idx, try_url in enumerate(urls_to_try):
+                yield {"stage": "fetching", "message": f"Loading {source.upper()} page" + (f" (attempt {try_idx + 1})" if try_idx > 0 else ""), "iteration": iteration}
+
+                step_start = time.time()
+                prefetched = prefetch.pop(_url_key(try_url), None)
+                if prefetched is not None:
+                    content, was_blocked = await prefetched
+                else:
+                    content, was_blocked = await _do_fetch(try_url, _needs_js_rendering(try_url))
+                step_duration = int((time.time() - step_start) * 1000)
+                tried_urls.add(_url_key(try_url))
+
+                steps.append(VerificationStep(
+                    iteration=iteration,
+                    action="fetch",
+                    input=try_url,
+                    output=f"{len(content)} chars" + (" [BLOCKED]" if was_blocked else ""),
+                    duration_ms=step_duration
+                ))
+
+                if was_blocked:
+                    yield {"stage": "blocked", "message": f"{source.upper()} blocked access" + (", trying alternative" if try_idx < len(urls_to_try) - 1 else ""), "iteration": iteration}
+                    continue  # Try next URL in urls_to_try
+
+                # Success - we got content
+                page_content = content
+                candidate.url = try_url  # Update candidate to the URL that worked
+                fetch_succeeded = True
+                stalled = 0
+                break
+
+            _cancel_prefetch(prefetch)
+
+            if not fetch_succeeded:
+                yield {"stage": "all_blocked", "message": f"All {source.upper()} URLs blocked, trying new search", "iteration": iteration}
+                search_query = f'{site_op} {business_name} {location.split(",")[0]} reviews'
+                continue  # Go to next iteration with modified search
+
+            # === STEP 4: Ask LLM to verify ===
+            yield {"stage": "verifying", "message": "Checking if this is the right business", "iteration": iteration}
+
+            verify_prompt = _verify_prompt(
+                business_name=business_name,
+                location=location,
+                url=candidate.url,
+                page_content=_extract_relevant(page_content, business_name, location)
+            )
 
             step_start = time.time()
-            needs_js = _needs_js_rendering(try_url)
-            content, was_blocked = _do_fetch(try_url, needs_js)
+            verify_response = await _call_llm(
+                verify_prompt,
+                semantic_scope=candidate.url,
+                semantic_key=f"{business_name} in {location}"
+            )
             step_duration = int((time.time() - step_start) * 1000)
 
             steps.append(VerificationStep(
                 iteration=iteration,
-                action="fetch",
-                input=try_url,
-                output=f"{len(content)} chars" + (" [BLOCKED]" if was_blocked else ""),
+                action="llm_verify",
+                input=candidate.url,
+                output=verify_response[:200],
                 duration_ms=step_duration
             ))
 
-            if was_blocked:
-                yield {"stage": "blocked", "message": f"{source.upper()} blocked access" + (", trying alternative" if try_idx < len(urls_to_try) - 1 else ""), "iteration": iteration}
-                continue  # Try next URL in urls_to_try
-
-            # Success - we got content
-            page_content = content
-            candidate.url = try_url  # Update candidate to the URL that worked
-            fetch_succeeded = True
-            break
-
-        if not fetch_succeeded:
-            yield {"stage": "all_blocked", "message": f"All {source.upper()} URLs blocked, trying new search", "iteration": iteration}
-            search_query = f'{site_op} {business_name} {location.split(",")[0]} reviews'
-            continue  # Go to next iteration with modified search
-
-        # === STEP 4: Ask LLM to verify ===
-        yield {"stage": "verifying", "message": "Checking if this is the right business", "iteration": iteration}
-
-        verify_prompt = VERIFY_PROMPT.format(
-            business_name=business_name,
-            location=location,
-            url=candidate.url,
-            page_content=page_content
-        )
-
-        step_start = time.time()
-        verify_response = _call_llm(verify_prompt)
-        step_duration = int((time.time() - step_start) * 1000)
-
-        steps.append(VerificationStep(
-            iteration=iteration,
-            action="llm_verify",
-            input=candidate.url,
-            output=verify_response[:200],
-            duration_ms=step_duration
-        ))
-
-        verify_data = _parse_json_response(verify_response)
-        if not verify_data:
-            logger.warning(f"Could not parse verify response: {verify_response[:200]}")
-            continue
+            verify_data = _parse_json_response(verify_response)
+            if not verify_data:
+                logger.warning(f"Could not parse verify response: {verify_response[:200]}")
+                continue
 
-        decision = verify_data.get("decision", "not_it")
+            decision = verify_data.get("decision", "not_it")
 
-        if decision == "confirmed":
-            # SUCCESS!
-            entity_data = verify_data.get("entity", {})
-            confirmed_entity = EntityCandidate(
-                name=entity_data.get("name", candidate.name),
-                url=entity_data.get("url", candidate.url),
-                reason=entity_data.get("reason", ""),
-                confidence=entity_data.get("confidence", "medium")
-            )
+            if decision == "confirmed":
+                # SUCCESS!
+                entity_data = verify_data.get("entity", {})
+                confirmed_entity = EntityCandidate(
+                    name=entity_data.get("name", candidate.name),
+                    url=entity_data.get("url", candidate.url),
+                    reason=entity_data.get("reason", ""),
+                    confidence=entity_data.get("confidence", "medium")
+                )
 
-            total_duration = int((time.time() - start_time) * 1000)
-            yield {"stage": "confirmed", "message": f"Found: {confirmed_entity.name}", "iteration": iteration}
+                total_duration = int((time.time() - start_time) * 1000)
+                yield {"stage": "confirmed", "message": f"Found: {confirmed_entity.name}", "iteration": iteration}
 
-            return VerificationResult(
-                status="confirmed",
-                entity=confirmed_entity,
-                page_content=page_content,  # Return for artifact collection
-                steps=steps,
-                total_duration_ms=total_duration,
-                message=f"Verified {confirmed_entity.name} on {source.upper()}"
-            )
+                yield VerificationResult(
+                    status="confirmed",
+                    entity=confirmed_entity,
+                    page_content=page_content,  # Return for artifact collection
+                    steps=steps,
+                    total_duration_ms=total_duration,
+                    message=f"Verified {confirmed_entity.name} on {source.upper()}"
+                )
+                return
 
-        elif decision == "give_up":
-            reason = verify_data.get("give_up_reason", "Could not verify")
-            total_duration = int((time.time() - start_time) * 1000)
-            yield {"stage": "gave_up", "message": f"Could not find business on {source.upper()}", "iteration": iteration}
-
-            return VerificationResult(
-                status="gave_up",
-                entity=None,
-                page_content=None,
-                steps=steps,
-                total_duration_ms=total_duration,
-                message=reason
-            )
+            elif decision == "give_up":
+                reason = verify_data.get("give_up_reason", "Could not verify")
+                total_duration = int((time.time() - start_time) * 1000)
+                yield {"stage": "gave_up", "message": f"Could not find business on {source.upper()}", "iteration": iteration}
 
-        else:  # not_it
-            next_search = verify_data.get("next_search", "")
-            if next_search:
-                yield {"stage": "not_it", "message": "Wrong business, searching again", "iteration": iteration}
-                search_query = f'{site_op} {next_search}'
-            else:
-                # Modify current search
-                search_query = f'{site_op} "{business_name}" exact {location}'
+                yield VerificationResult(
+                    status="gave_up",
+                    entity=None,
+                    page_content=None,
+                    steps=steps,
+                    total_duration_ms=total_duration,
+                    message=reason
+                )
+                return
+
+            else:  # not_it
+                next_search = verify_data.get("next_search", "")
+                if next_search:
+                    yield {"stage": "not_it", "message": "Wrong business, searching again", "iteration": iteration}
+                    search_query = f'{site_op} {next_search}'
+                else:
+                    # Modify current search
+                    search_query = f'{site_op} "{business_name}" exact {location}'
+    finally:
+        _cancel_prefetch(prefetch)
 
-    # Max iterations reached
+    # Out of iterations, time, or progress
     total_duration = int((time.time() - start_time) * 1000)
-    return VerificationResult(
+    yield VerificationResult(
         status="gave_up",
         entity=None,
         page_content=None,
         steps=steps,
         total_duration_ms=total_duration,
-        message=f"Could not verify entity after {MAX_ITERATIONS} attempts"
+        message=stop_reason
     )
+    return
 
 
 # =============================================================================
@@ -669,11 +891,15 @@ def verify_entity_sync(
     source: str,
     db,
     user_id: int,
-    context: Dict[str, Any]
+    context: Dict[str, Any],
+    on_event: Optional[Callable[[Dict[str, Any]], None]] = None
 ) -> tuple[VerificationResult, List[Dict[str, Any]]]:
     """
-    Synchronous wrapper that collects all progress and returns final result.
+    Synchronous wrapper that runs verification and returns final result.
     Returns (result, progress_events).
+
+    If on_event is given, each progress event is passed to it as it happens
+    and progress_events is returned empty instead of buffering the run.
     """
     progress_events = []
     result = None
@@ -683,7 +909,10 @@ def verify_entity_sync(
     try:
         while True:
             progress = next(gen)
-            progress_events.append(progress)
+            if on_event:
+                on_event(progress)
+            else:
+                progress_events.append(progress)
     except StopIteration as e:
         result = e.value
 
@@ -5,22 +5,31 @@ Processes each item in a list with an operation (LLM prompt, tool call, or agent
 Supports parallel execution for efficiency, or sequential for rate-limited APIs.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
+import queue
+import tempfile
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generator, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 import anthropic
+import orjson
+from cachetools import TTLCache
 from pydantic import BaseModel
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from models import Asset, AssetType
 from tools.registry import ToolConfig, ToolResult, ToolProgress, register_tool, get_tool, get_all_tools
-from tools.executor import execute_tool_sync
+from tools.builtin.llm_cache import llm_cache
+from tools.executor import execute_tool_sync, submit_to_background_loop
 
 # Note: run_agent_loop_sync imported lazily in _process_item_agent to avoid circular import
 
@@ -29,9 +38,42 @@ logger = logging.getLogger(__name__)
 # Configuration
 ITERATOR_MODEL = "claude-sonnet-4-20250514"
 ITERATOR_MAX_TOKENS = 2048
+ITERATOR_TEMPERATURE = 0  # Deterministic, so identical prompts can share a cached completion
 AGENT_MAX_ITERATIONS = 10  # Prevent infinite loops
 DEFAULT_MAX_CONCURRENCY = 5
 DEFAULT_SEQUENTIAL_DELAY = 0.1  # Small delay between items in sequential mode
+LLM_MAX_RETRIES = 4  # SDK retries of 408/409/429/5xx and connection errors (honors retry-after)
+CANCEL_POLL_INTERVAL = 0.5  # Seconds between cancellation checks while awaiting async results
+BATCH_MIN_ITEMS = 10  # Below this, per-item calls finish sooner than a batch round-trip
+BATCH_POLL_INITIAL = 2.0  # Seconds before the first batch status poll
+BATCH_POLL_MAX = 10.0  # Backoff cap between batch status polls
+CHECKPOINT_DIR = tempfile.gettempdir()
+CHECKPOINT_FSYNC_EVERY = 10  # Items between fsyncs of the checkpoint file
+CHECKPOINT_MAX_AGE = 30 * 60  # Seconds; older checkpoints are stale and deleted instead of resumed
+ASSET_ITEMS_CACHE_SIZE = 64
+ASSET_ITEMS_CACHE_TTL = 60  # Seconds
+
+# Parsed LIST asset items keyed by (user_id, asset_id, MD5 of content)
+_asset_items_cache: TTLCache = TTLCache(maxsize=ASSET_ITEMS_CACHE_SIZE, ttl=ASSET_ITEMS_CACHE_TTL)
+_asset_items_lock = threading.Lock()
+
+_client: Optional[anthropic.Anthropic] = None
+_async_client: Optional[anthropic.AsyncAnthropic] = None
+
+
+def _get_client() -> anthropic.Anthropic:
+    """Shared sync client so worker threads reuse one HTTP connection pool."""
+    global _client
+    if _client is None:
+        _client = anthropic.Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'), max_retries=LLM_MAX_RETRIES)
+    return _client
+
+
+def _get_async_client() -> anthropic.AsyncAnthropic:
+    global _async_client
+    if _async_client is None:
+        _async_client = anthropic.AsyncAnthropic(api_key=os.getenv('ANTHROPIC_API_KEY'), max_retries=LLM_MAX_RETRIES)
+    return _async_client
 
 
 # =============================================================================
@@ -56,9 +98,10 @@ class IteratorParams(BaseModel):
     max_concurrency: int = DEFAULT_MAX_CONCURRENCY
     sequential: bool = False
     delay_between_items: float = DEFAULT_SEQUENTIAL_DELAY
+    use_batch_api: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemResult:
     """Result of processing a single item."""
     item: Any  # Original item (can be any type)
@@ -67,6 +110,15 @@ class ItemResult:
     success: bool
     error: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "item": self.item,  # Original item (can be any type)
+            "item_str": self.item_str,  # String representation for display
+            "result": self.result,
+            "success": self.success,
+            "error": self.error
+        }
+
 
 def _item_to_string(item: Any) -> str:
     """Convert any item to a string representation for use in prompts/templates."""
@@ -78,46 +130,70 @@ def _item_to_string(item: Any) -> str:
         return str(item)
 
 
+def _compile_template(template: Any) -> Callable[[Any], Any]:
+    """
+    Precompile a template into a function of the item.
+
+    The template tree is walked once; leaves without an {item} or {item.key}
+    placeholder are returned as-is on every call instead of being re-scanned.
+    """
+    def build(node: Any) -> Callable[[Any, str], Any]:
+        if isinstance(node, str):
+            if "{item" not in node:
+                return lambda item, item_str: node
+
+            def substitute(item: Any, item_str: str) -> str:
+                result = node.replace("{item}", item_str)
+                # Also support {item.key} syntax for dict items
+                if isinstance(item, dict):
+                    for key, value in item.items():
+                        result = result.replace(f"{{item.{key}}}", _item_to_string(value))
+                return result
+            return substitute
+        elif isinstance(node, dict):
+            fields = [(k, build(v)) for k, v in node.items()]
+            return lambda item, item_str: {k: f(item, item_str) for k, f in fields}
+        elif isinstance(node, list):
+            elements = [build(v) for v in node]
+            return lambda item, item_str: [f(item, item_str) for f in elements]
+        else:
+            return lambda item, item_str: node
+
+    render = build(template)
+    return lambda item: render(item, _item_to_string(item))
+
+
 def _substitute_item(template: Any, item: Any) -> Any:
     """
-    Recursively substitute {item} placeholder in a template.
+    Substitute {item} placeholder in a template.
 
     For string templates, replaces {item} with the string representation.
     For dict/list templates, can also use {item.key} syntax for object items.
     """
-    item_str = _item_to_string(item)
-
-    if isinstance(template, str):
-        result = template.replace("{item}", item_str)
-        # Also support {item.key} syntax for dict items
-        if isinstance(item, dict):
-            for key, value in item.items():
-                result = result.replace(f"{{item.{key}}}", _item_to_string(value))
-        return result
-    elif isinstance(template, dict):
-        return {k: _substitute_item(v, item) for k, v in template.items()}
-    elif isinstance(template, list):
-        return [_substitute_item(v, item) for v in template]
-    else:
-        return template
+    return _compile_template(template)(item)
 
 
 def _process_item_llm(item: Any, prompt: str) -> ItemResult:
     """Process a single item using LLM."""
     item_str = _item_to_string(item)
     try:
-        client = anthropic.Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
-
         # Substitute {item} in the prompt
         full_prompt = _substitute_item(prompt, item)
 
-        response = client.messages.create(
+        cache_key = llm_cache.make_key(ITERATOR_MODEL, ITERATOR_MAX_TOKENS, full_prompt)
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            return ItemResult(item=item, item_str=item_str, result=cached, success=True)
+
+        response = _get_client().messages.create(
             model=ITERATOR_MODEL,
             max_tokens=ITERATOR_MAX_TOKENS,
+            temperature=ITERATOR_TEMPERATURE,
             messages=[{"role": "user", "content": full_prompt}]
         )
 
         result_text = response.content[0].text if response.content else ""
+        llm_cache.set(cache_key, result_text)
         return ItemResult(item=item, item_str=item_str, result=result_text, success=True)
 
     except Exception as e:
@@ -125,21 +201,112 @@ def _process_item_llm(item: Any, prompt: str) -> ItemResult:
         return ItemResult(item=item, item_str=item_str, result="", success=False, error=str(e))
 
 
+async def _aprocess_item_llm(item: Any, prompt: str) -> ItemResult:
+    """Process a single item using LLM (async)."""
+    item_str = _item_to_string(item)
+    try:
+        full_prompt = _substitute_item(prompt, item)
+
+        cache_key = llm_cache.make_key(ITERATOR_MODEL, ITERATOR_MAX_TOKENS, full_prompt)
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            return ItemResult(item=item, item_str=item_str, result=cached, success=True)
+
+        response = await _get_async_client().messages.create(
+            model=ITERATOR_MODEL,
+            max_tokens=ITERATOR_MAX_TOKENS,
+            temperature=ITERATOR_TEMPERATURE,
+            messages=[{"role": "user", "content": full_prompt}]
+        )
+
+        result_text = response.content[0].text if response.content else ""
+        llm_cache.set(cache_key, result_text)
+        return ItemResult(item=item, item_str=item_str, result=result_text, success=True)
+
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.error(f"LLM processing error for item '{item_str}': {e}")
+        return ItemResult(item=item, item_str=item_str, result="", success=False, error=str(e))
+
+
+async def _aprocess_items_llm(
+    work: List[Tuple[int, Any]],
+    prompt: str,
+    max_concurrency: int,
+    results_queue: "queue.Queue[Tuple[int, ItemResult]]"
+) -> None:
+    """
+    Run LLM items concurrently (bounded by a semaphore), reporting each as it finishes.
+
+    Items that render to the same prompt share one call; every index still gets
+    its own result on the queue.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    groups: Dict[str, List[Tuple[int, Any]]] = {}
+    for idx, item in work:
+        groups.setdefault(_substitute_item(prompt, item), []).append((idx, item))
+
+    async def run(members: List[Tuple[int, Any]]):
+        async with semaphore:
+            result = await _aprocess_item_llm(members[0][1], prompt)
+        results_queue.put((members[0][0], result))
+        for index, item in members[1:]:
+            results_queue.put((index, ItemResult(
+                item=item, item_str=_item_to_string(item),
+                result=result.result, success=result.success, error=result.error
+            )))
+
+    await asyncio.gather(*(run(members) for members in groups.values()))
+
+
+def _item_complete_progress(index: int, result: ItemResult, completed: int, total: int) -> ToolProgress:
+    """Per-item completion event for live UI update."""
+    return ToolProgress(
+        stage="item_complete",
+        message=f"Completed: {result.item_str[:50]}..." if len(result.item_str) > 50 else f"Completed: {result.item_str}",
+        data={
+            "index": index,
+            "item": result.item,
+            "item_str": result.item_str,
+            "result": result.result[:500] if result.result else "",
+            "success": result.success,
+            "error": result.error,
+            "completed": completed,
+            "total": total
+        },
+        progress=completed / total
+    )
+
+
+def _cancelled_result(results: List[Optional[ItemResult]], completed: int, total: int) -> ToolResult:
+    """Partial result returned when the iterator is cancelled."""
+    final_results = [r for r in results if r is not None]
+    return ToolResult(
+        text=f"Iterator cancelled after processing {completed}/{total} items",
+        data={
+            "partial": True,
+            "results": [r.to_dict() for r in final_results]
+        }
+    )
+
+
 def _process_item_tool(
     item: Any,
     tool_name: str,
-    params_template: Dict[str, Any],
+    render_params: Callable[[Any], Dict[str, Any]],
     db: Session,
     user_id: int
 ) -> ItemResult:
-    """Process a single item using a tool."""
+    """Process a single item using a tool; render_params comes from _compile_template."""
     item_str = _item_to_string(item)
     tool_config = get_tool(tool_name)
     if not tool_config:
         return ItemResult(item=item, item_str=item_str, result="", success=False, error=f"Tool '{tool_name}' not found")
 
     # Substitute {item} in the params template
-    params = _substitute_item(params_template, item)
+    params = render_params(item)
 
     # Execute using shared utility (handles streaming and non-streaming tools)
     result = execute_tool_sync(tool_config, params, db, user_id)
@@ -237,29 +404,132 @@ def _process_item_agent(
         return ItemResult(item=item, item_str=item_str, result="", success=False, error=str(e))
 
 
+class _Checkpoint:
+    """
+    Append-only JSONL log of successful item results for one iterate call.
+
+    The file name is derived from the user, operation and items, so re-running
+    the same call after a crash or cancellation skips items that already
+    succeeded. Each line is flushed as it is written; fsync runs every
+    CHECKPOINT_FSYNC_EVERY items and on close.
+
+    Only llm operations are checkpointed: tool and agent results depend on
+    time and the web, so replaying them would be wrong. A checkpoint not
+    written to within CHECKPOINT_MAX_AGE is discarded rather than resumed.
+    """
+
+    def __init__(self, user_id: int, operation: IteratorOperationParams, items: List[Any]):
+        digest = hashlib.sha256(orjson.dumps(
+            {"operation": operation.model_dump(), "items": items},
+            option=orjson.OPT_SORT_KEYS
+        )).hexdigest()[:16]
+        self.path = os.path.join(CHECKPOINT_DIR, f"iterate_{user_id}_{digest}.jsonl")
+        self.enabled = operation.type == "llm"
+        self._file = None
+        self._unsynced = 0
+
+    def load(self, items: List[Any]) -> Dict[int, ItemResult]:
+        """Read back results saved by a recent earlier run of the same call."""
+        done: Dict[int, ItemResult] = {}
+        if not self.enabled:
+            return done
+        try:
+            if time.time() - os.path.getmtime(self.path) > CHECKPOINT_MAX_AGE:
+                logger.info(f"Discarding stale iterator checkpoint {self.path}")
+                os.remove(self.path)
+                return done
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue  # Torn last line from a crash mid-write
+                    index = record.get("index")
+                    if isinstance(index, int) and 0 <= index < len(items):
+                        done[index] = ItemResult(
+                            item=items[index], item_str=record["item_str"], result=record["result"], success=True
+                        )
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not read iterator checkpoint {self.path}: {e}")
+        return done
+
+    def record(self, index: int, result: ItemResult) -> None:
+        """Append a successful result; failures are retried on resume."""
+        if not self.enabled or not result.success:
+            return
+        try:
+            if self._file is None:
+                self._file = open(self.path, 'ab')
+            self._file.write(orjson.dumps({"index": index, "item_str": result.item_str, "result": result.result}) + b"\n")
+            self._file.flush()
+            self._unsynced += 1
+            if self._unsynced >= CHECKPOINT_FSYNC_EVERY:
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
+        except OSError as e:
+            logger.warning(f"Could not write iterator checkpoint {self.path}: {e}")
+
+    def close(self) -> None:
+        """Sync and close, keeping the file for a later resume."""
+        if self._file is None:
+            return
+        try:
+            if self._unsynced:
+                os.fsync(self._file.fileno())
+            self._file.close()
+        except OSError as e:
+            logger.warning(f"Could not close iterator checkpoint {self.path}: {e}")
+        self._file = None
+        self._unsynced = 0
+
+    def discard(self) -> None:
+        """Remove the checkpoint once every item has succeeded."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove iterator checkpoint {self.path}: {e}")
+
+
 def _load_items_from_asset(db: Session, user_id: int, asset_id: int) -> List[Any]:
     """Load items from a LIST asset. Items can be any JSON-serializable type."""
-    asset = db.query(Asset).filter(
+    # Check type and a server-side content digest first; content is only read on a
+    # cache miss. updated_at has one-second resolution, so it can't version the content.
+    meta = db.query(Asset.asset_type, func.md5(Asset.content).label("content_md5")).filter(
         Asset.asset_id == asset_id,
         Asset.user_id == user_id
     ).first()
 
-    if not asset:
+    if not meta:
         raise ValueError(f"Asset {asset_id} not found")
 
-    if asset.asset_type != AssetType.LIST:
-        raise ValueError(f"Asset {asset_id} is not a LIST type (got {asset.asset_type})")
+    if meta.asset_type != AssetType.LIST:
+        raise ValueError(f"Asset {asset_id} is not a LIST type (got {meta.asset_type})")
+
+    cache_key = (user_id, asset_id, meta.content_md5)
+    with _asset_items_lock:
+        cached = _asset_items_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
 
-    if not asset.content:
+    content = db.query(Asset.content).filter(Asset.asset_id == asset_id).scalar()
+    if not content:
         raise ValueError(f"Asset {asset_id} has no content")
 
     try:
-        items = json.loads(asset.content)
-        if not isinstance(items, list):
-            raise ValueError(f"Asset {asset_id} content is not a JSON array")
-        return items  # Return items as-is, preserving their types
-    except json.JSONDecodeError as e:
+        items = orjson.loads(content)
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Asset {asset_id} content is not valid JSON: {e}")
+    if not isinstance(items, list):
+        raise ValueError(f"Asset {asset_id} content is not a JSON array")
+
+    with _asset_items_lock:
+        _asset_items_cache[cache_key] = items
+    return list(items)  # Return items as-is, preserving their types
 
 
 def execute_iterate(
@@ -307,10 +577,17 @@ def execute_iterate(
         return ToolResult(text="Agent operation requires a 'tools' field with at least one tool")
 
     total = len(items)
-    completed = 0
     # Pre-allocate results list to maintain order
     results: List[Optional[ItemResult]] = [None] * total
 
+    # Resume from a checkpoint left by an interrupted run of the same call
+    checkpoint = _Checkpoint(user_id, operation, items)
+    restored = checkpoint.load(items)
+    for idx, result in restored.items():
+        results[idx] = result
+    completed = len(restored)
+    work = [(idx, item) for idx, item in enumerate(items) if results[idx] is None]
+
     # Send starting event with full items list for UI rendering
     mode_str = "sequentially" if typed_params.sequential else f"in parallel (max {typed_params.max_concurrency})"
     yield ToolProgress(
@@ -325,13 +602,21 @@ def execute_iterate(
         progress=0.0
     )
 
+    if restored:
+        logger.info(f"Iterator resuming: {len(restored)}/{total} items restored from {checkpoint.path}")
+        for n, (idx, result) in enumerate(sorted(restored.items()), start=1):
+            yield _item_complete_progress(idx, result, n, total)
+
+    # Tool params template is compiled once rather than re-walked per item
+    render_tool_params = _compile_template(operation.tool_params_template or {})
+
     # Process items
     def process_item_with_index(index: int, item: Any) -> Tuple[int, ItemResult]:
         item_str = _item_to_string(item)
         if operation.type == "llm":
             return index, _process_item_llm(item, operation.prompt)
         elif operation.type == "tool":
-            return index, _process_item_tool(item, operation.tool_name, operation.tool_params_template or {}, db, user_id)
+            return index, _process_item_tool(item, operation.tool_name, render_tool_params, db, user_id)
         elif operation.type == "agent":
             return index, _process_item_agent(
                 item, operation.prompt, operation.tools or [], operation.max_iterations, db, user_id, cancellation_token
@@ -341,7 +626,7 @@ def execute_iterate(
 
     # Sequential processing for rate-limited APIs
     if typed_params.sequential:
-        for idx, item in enumerate(items):
+        for idx, item in work:
             # Check for cancellation
             if cancellation_token and cancellation_token.is_cancelled:
                 logger.info("Iterator cancelled")
@@ -350,18 +635,13 @@ def execute_iterate(
                     message=f"Cancelled after processing {completed}/{total} items",
                     data={"completed": completed, "total": total}
                 )
-                final_results = [r for r in results if r is not None]
-                return ToolResult(
-                    text=f"Iterator cancelled after processing {completed}/{total} items",
-                    data={
-                        "partial": True,
-                        "results": [{"item": r.item, "item_str": r.item_str, "result": r.result, "success": r.success, "error": r.error} for r in final_results]
-                    }
-                )
+                checkpoint.close()
+                return _cancelled_result(results, completed, total)
 
             try:
                 _, result = process_item_with_index(idx, item)
                 results[idx] = result
+                checkpoint.record(idx, result)
                 completed += 1
 
                 yield ToolProgress(
@@ -411,112 +691,227 @@ def execute_iterate(
                 if idx < len(items) - 1:
                     time.sleep(typed_params.delay_between_items)
 
-    else:
-        # Parallel processing with ThreadPoolExecutor
-        from concurrent.futures import as_completed
-
-        with ThreadPoolExecutor(max_workers=typed_params.max_concurrency) as executor:
-            # Submit all tasks with their indices
-            futures = {
-                executor.submit(process_item_with_index, idx, item): idx
-                for idx, item in enumerate(items)
-            }
+    elif operation.type == "llm" and typed_params.use_batch_api and total >= BATCH_MIN_ITEMS:
+        # Message Batches API: one submission for every uncached item, at half the
+        # token cost; results typically take minutes, so this is opt-in
+        client = _get_client()
+
+        pending: Dict[str, List[int]] = {}  # cache key -> indices rendering to that prompt
+        requests = []
+        for idx, item in work:
+            full_prompt = _substitute_item(operation.prompt, item)
+            cache_key = llm_cache.make_key(ITERATOR_MODEL, ITERATOR_MAX_TOKENS, full_prompt)
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                results[idx] = ItemResult(item=item, item_str=_item_to_string(item), result=cached, success=True)
+                checkpoint.record(idx, results[idx])
+                completed += 1
+                yield _item_complete_progress(idx, results[idx], completed, total)
+                continue
+            if cache_key in pending:
+                # Duplicate prompt: answered by the first item's request
+                pending[cache_key].append(idx)
+                continue
+            pending[cache_key] = [idx]
+            requests.append({
+                "custom_id": cache_key,
+                "params": {
+                    "model": ITERATOR_MODEL,
+                    "max_tokens": ITERATOR_MAX_TOKENS,
+                    "temperature": ITERATOR_TEMPERATURE,
+                    "messages": [{"role": "user", "content": full_prompt}]
+                }
+            })
+
+        if requests:
+            batch = client.messages.batches.create(requests=requests)
+            yield ToolProgress(
+                stage="batch_submitted",
+                message=f"Submitted {len(requests)} items as a batch",
+                data={"batch_id": batch.id, "completed": completed, "total": total},
+                progress=completed / total
+            )
 
-            # Process completed tasks as they finish (in completion order)
-            for future in as_completed(futures):
-                # Check for cancellation
-                if cancellation_token and cancellation_token.is_cancelled:
-                    logger.info("Iterator cancelled")
-                    executor.shutdown(wait=False, cancel_futures=True)
-                    yield ToolProgress(
-                        stage="cancelled",
-                        message=f"Cancelled after processing {completed}/{total} items",
-                        data={"completed": completed, "total": total}
-                    )
-                    # Collect completed results
-                    final_results = [r for r in results if r is not None]
-                    return ToolResult(
-                        text=f"Iterator cancelled after processing {completed}/{total} items",
-                        data={
-                            "partial": True,
-                            "results": [{"item": r.item, "item_str": r.item_str, "result": r.result, "success": r.success, "error": r.error} for r in final_results]
-                        }
-                    )
-
-                try:
-                    index, result = future.result(timeout=60)  # 60 second timeout per item
-                    results[index] = result
+            delay = BATCH_POLL_INITIAL
+            while batch.processing_status != "ended":
+                waited = 0.0
+                while waited < delay:
+                    if cancellation_token and cancellation_token.is_cancelled:
+                        logger.info("Iterator cancelled")
+                        client.messages.batches.cancel(batch.id)
+                        yield ToolProgress(
+                            stage="cancelled",
+                            message=f"Cancelled after processing {completed}/{total} items",
+                            data={"completed": completed, "total": total}
+                        )
+                        checkpoint.close()
+                        return _cancelled_result(results, completed, total)
+                    time.sleep(CANCEL_POLL_INTERVAL)
+                    waited += CANCEL_POLL_INTERVAL
+                delay = min(delay * 2, BATCH_POLL_MAX)
+                batch = client.messages.batches.retrieve(batch.id)
+
+            for entry in client.messages.batches.results(batch.id):
+                if entry.result.type == "succeeded":
+                    content = entry.result.message.content
+                    result_text, success, error = (content[0].text if content else ""), True, None
+                    llm_cache.set(entry.custom_id, result_text)
+                else:
+                    result_text, success = "", False
+                    error = str(entry.result.error) if entry.result.type == "errored" else f"Batch request {entry.result.type}"
+                for idx in pending[entry.custom_id]:
+                    item = items[idx]
+                    result = ItemResult(item=item, item_str=_item_to_string(item), result=result_text, success=success, error=error)
+                    results[idx] = result
+                    checkpoint.record(idx, result)
                     completed += 1
+                    yield _item_complete_progress(idx, result, completed, total)
+
+    elif operation.type == "llm":
+        # Parallel LLM calls run as coroutines on the shared background loop;
+        # results arrive on a queue in completion order
+        results_queue: "queue.Queue[Tuple[int, ItemResult]]" = queue.Queue()
+        batch_future = submit_to_background_loop(
+            _aprocess_items_llm(work, operation.prompt, typed_params.max_concurrency, results_queue)
+        )
 
-                    # Send per-item completion event for live UI update
-                    yield ToolProgress(
-                        stage="item_complete",
-                        message=f"Completed: {result.item_str[:50]}..." if len(result.item_str) > 50 else f"Completed: {result.item_str}",
-                        data={
-                            "index": index,
-                            "item": result.item,
-                            "item_str": result.item_str,
-                            "result": result.result[:500] if result.result else "",  # Truncate for progress
-                            "success": result.success,
-                            "error": result.error,
-                            "completed": completed,
-                            "total": total
-                        },
-                        progress=completed / total
-                    )
-                except Exception as e:
-                    logger.error(f"Error processing item: {e}")
-                    idx = futures[future]
-                    item_str = _item_to_string(items[idx])
-                    error_result = ItemResult(item=items[idx], item_str=item_str, result="", success=False, error=str(e))
-                    results[idx] = error_result
-                    completed += 1
+        while completed < total:
+            # Check for cancellation
+            if cancellation_token and cancellation_token.is_cancelled:
+                logger.info("Iterator cancelled")
+                batch_future.cancel()
+                yield ToolProgress(
+                    stage="cancelled",
+                    message=f"Cancelled after processing {completed}/{total} items",
+                    data={"completed": completed, "total": total}
+                )
+                checkpoint.close()
+                return _cancelled_result(results, completed, total)
 
-                    yield ToolProgress(
-                        stage="item_complete",
-                        message=f"Failed: {item_str[:50]}..." if len(item_str) > 50 else f"Failed: {item_str}",
-                        data={
-                            "index": idx,
-                            "item": items[idx],
-                            "item_str": item_str,
-                            "result": "",
-                            "success": False,
-                            "error": str(e),
-                            "completed": completed,
-                            "total": total
-                        },
-                        progress=completed / total
-                    )
+            try:
+                index, result = results_queue.get(timeout=CANCEL_POLL_INTERVAL)
+            except queue.Empty:
+                if batch_future.done() and results_queue.empty():
+                    # Driver ended without reporting every item (unexpected error)
+                    if batch_future.exception():
+                        logger.error(f"LLM batch failed: {batch_future.exception()}")
+                    break
+                continue
+
+            results[index] = result
+            checkpoint.record(index, result)
+            completed += 1
+            yield _item_complete_progress(index, result, completed, total)
+
+    else:
+        # Parallel processing with ThreadPoolExecutor (tool/agent operations use the sync DB session)
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        with ThreadPoolExecutor(max_workers=typed_params.max_concurrency) as executor:
+            # Keep a bounded window of submitted items rather than one future per item
+            max_in_flight = typed_params.max_concurrency * 2
+            pending_work = iter(work)
+            futures: Dict[Any, int] = {}
+
+            def submit_more() -> None:
+                for idx, item in pending_work:
+                    futures[executor.submit(process_item_with_index, idx, item)] = idx
+                    if len(futures) >= max_in_flight:
+                        return
+
+            submit_more()
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                # Process completed tasks as they finish (in completion order)
+                for future in done:
+                    # Check for cancellation
+                    if cancellation_token and cancellation_token.is_cancelled:
+                        logger.info("Iterator cancelled")
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        yield ToolProgress(
+                            stage="cancelled",
+                            message=f"Cancelled after processing {completed}/{total} items",
+                            data={"completed": completed, "total": total}
+                        )
+                        checkpoint.close()
+                        return _cancelled_result(results, completed, total)
+
+                    try:
+                        index, result = future.result()  # already done: wait() only returns finished futures
+                        results[index] = result
+                        checkpoint.record(index, result)
+                        completed += 1
+
+                        # Send per-item completion event for live UI update
+                        yield ToolProgress(
+                            stage="item_complete",
+                            message=f"Completed: {result.item_str[:50]}..." if len(result.item_str) > 50 else f"Completed: {result.item_str}",
+                            data={
+                                "index": index,
+                                "item": result.item,
+                                "item_str": result.item_str,
+                                "result": result.result[:500] if result.result else "",  # Truncate for progress
+                                "success": result.success,
+                                "error": result.error,
+                                "completed": completed,
+                                "total": total
+                            },
+                            progress=completed / total
+                        )
+                    except Exception as e:
+                        logger.error(f"Error processing item: {e}")
+                        idx = futures[future]
+                        item_str = _item_to_string(items[idx])
+                        error_result = ItemResult(item=items[idx], item_str=item_str, result="", success=False, error=str(e))
+                        results[idx] = error_result
+                        completed += 1
+
+                        yield ToolProgress(
+                            stage="item_complete",
+                            message=f"Failed: {item_str[:50]}..." if len(item_str) > 50 else f"Failed: {item_str}",
+                            data={
+                                "index": idx,
+                                "item": items[idx],
+                                "item_str": item_str,
+                                "result": "",
+                                "success": False,
+                                "error": str(e),
+                                "completed": completed,
+                                "total": total
+                            },
+                            progress=completed / total
+                        )
+
+                    del futures[future]
+
+                submit_more()
 
     # Format final results (filter out any None values, though there shouldn't be any)
     final_results = [r for r in results if r is not None]
     successful = sum(1 for r in final_results if r.success)
     failed = len(final_results) - successful
 
+    # Keep the checkpoint while anything failed so a retry only redoes those items
+    if failed == 0 and len(final_results) == total:
+        checkpoint.discard()
+    else:
+        checkpoint.close()
+
     # Build output text (use item_str for display)
-    output_lines = [f"Processed {total} items ({successful} successful, {failed} failed):\n"]
-    for r in final_results:
-        if r.success:
-            output_lines.append(f"- **{r.item_str}**: {r.result}")
-        else:
-            output_lines.append(f"- **{r.item_str}**: [ERROR] {r.error}")
+    header = f"Processed {total} items ({successful} successful, {failed} failed):\n"
+    text = "\n".join((header, *(
+        f"- **{r.item_str}**: {r.result}" if r.success else f"- **{r.item_str}**: [ERROR] {r.error}"
+        for r in final_results
+    )))
 
     return ToolResult(
-        text="\n".join(output_lines),
+        text=text,
         data={
             "total": total,
             "successful": successful,
             "failed": failed,
-            "results": [
-                {
-                    "item": r.item,  # Original item (can be any type)
-                    "item_str": r.item_str,  # String representation for display
-                    "result": r.result,
-                    "success": r.success,
-                    "error": r.error
-                }
-                for r in final_results
-            ]
+            "results": [r.to_dict() for r in final_results]
         }
     )
 
@@ -583,6 +978,11 @@ ITERATE_TOOL = ToolConfig(
                 "type": "number",
                 "description": "Seconds to wait between items in sequential mode (default: 0.5). Only applies when sequential=true.",
                 "default": 0.5
+            },
+            "use_batch_api": {
+                "type": "boolean",
+                "description": "For LLM operations on 10+ items when latency is not critical: submit all items as one Anthropic message batch (half the cost, results usually within minutes). Ignored if sequential=true.",
+                "default": False
             }
         },
         "required": ["operation"]
@@ -0,0 +1,104 @@
+"""
+LLM response cache for built-in tools.
+
+In-process, content-addressed cache of completion text keyed by a hash of the
+model, max_tokens and prompt. Shared by tools that re-issue identical prompts
+(entity verification retries, iterator items that repeat across runs).
+
+SemanticCache adds an embedding-similarity layer for near-duplicate prompts.
+"""
+
+import hashlib
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from cachetools import TTLCache
+
+DEFAULT_MAXSIZE = 500
+DEFAULT_TTL_SECONDS = 3600
+
+
+class LLMCache:
+    """Thread-safe TTL cache of LLM completion text."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: int = DEFAULT_TTL_SECONDS):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, max_tokens: int, prompt: str) -> str:
+        """Build the cache key for a single-message prompt."""
+        return hashlib.sha256(f"{model}\0{max_tokens}\0{prompt}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: str, text: str) -> None:
+        with self._lock:
+            self._cache[key] = text
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+# Shared instance used by the built-in tools
+llm_cache = LLMCache()
+
+
+class SemanticCache:
+    """
+    Embedding-similarity cache of LLM completion text.
+
+    Entries are partitioned by an exact-match scope (e.g. the URL being verified)
+    and matched within a scope by cosine similarity of a short semantic key, so
+    cosmetically different phrasings of the same question reuse one answer
+    without ever crossing to a different subject.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 1000):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._scopes: Dict[str, Tuple[Any, List[str]]] = {}  # scope -> (faiss index, responses)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vec = np.asarray(embedding, dtype=np.float32).reshape(1, -1)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def lookup(self, scope: str, embedding: List[float]) -> Optional[str]:
+        with self._lock:
+            entry = self._scopes.get(scope)
+            if entry is None:
+                return None
+            index, responses = entry
+            scores, ids = index.search(self._normalize(embedding), 1)
+            if ids[0][0] >= 0 and scores[0][0] >= self.threshold:
+                return responses[ids[0][0]]
+            return None
+
+    def add(self, scope: str, embedding: List[float], response: str) -> None:
+        import faiss
+
+        vec = self._normalize(embedding)
+        with self._lock:
+            # Flat indexes can't evict individual entries; start over when full
+            if self._count >= self.max_entries:
+                self._scopes.clear()
+                self._count = 0
+            entry = self._scopes.get(scope)
+            if entry is None:
+                entry = (faiss.IndexFlatIP(vec.shape[1]), [])
+                self._scopes[scope] = entry
+            entry[0].add(vec)
+            entry[1].append(response)
+            self._count += 1
+
+
+# Shared instance for near-duplicate verification decisions
+semantic_llm_cache = SemanticCache()
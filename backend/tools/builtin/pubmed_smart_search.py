@@ -14,16 +14,24 @@ This is more intelligent than raw pubmed_search because it:
 - Provides transparency into the search process
 """
 
+import hashlib
 import json
 import logging
 import os
+import re
 import asyncio
-from typing import Any, Dict, Generator, List, Optional, Set
-from dataclasses import dataclass, field
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FuturesTimeout, wait
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Generator, List, Optional, Set, Tuple
+from dataclasses import dataclass
 from sqlalchemy.orm import Session
 import anthropic
+import numpy as np
+from cachetools import TTLCache
 
-from tools.registry import ToolConfig, ToolResult, ToolProgress, register_tool
+from tools.builtin.llm_cache import SemanticCache
+from tools.registry import ToolConfig, ToolResult, ToolProgress
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +39,100 @@ SMART_SEARCH_MODEL = "claude-sonnet-4-20250514"
 MAX_QUERIES = 5
 MAX_RESULTS_PER_QUERY = 20
 MAX_TOTAL_RESULTS = 50
-BATCH_SIZE_FOR_FILTERING = 10
+SCORING_MODEL = "claude-3-5-haiku-20241022"  # Relevance scoring is a cheap classification task
+SCORING_ABSTRACT_CHARS = 300
+RELEVANCE_MIN_SCORE = 6  # 0-10 scale
+AMBIGUOUS_MIN_SCORE = RELEVANCE_MIN_SCORE - 1  # Scores up to the cutoff from here are re-checked by SMART_SEARCH_MODEL
+QUERY_DUPLICATE_JACCARD = 0.8  # Token overlap above which a generated query is dropped
+SEARCH_CONCURRENCY = 3  # Parallel PubMed queries; NCBI allows 3 req/s without an API key
+PUBMED_CACHE_SIZE = 256
+PUBMED_CACHE_TTL = 3 * 3600  # Seconds; PubMed results for a query barely move within hours
+PREFILTER_MIN_SIMILARITY = 0.25  # Cosine floor for an article to reach the LLM filter
+SCORING_CANDIDATES_PER_RESULT = 3  # Most-similar candidates scored per requested result
+LLM_MAX_RETRIES = 2
+LLM_CALL_WORKERS = 8  # Shared across concurrent searches
+CANCEL_POLL_SECONDS = 0.1
+LLM_TIMEOUT_SECONDS = 60
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("PUBMED_SEMANTIC_CACHE_THRESHOLD", "0.92"))
+
+_DATE_RANGE_DAYS = {
+    "last_week": 7,
+    "last_month": 30,
+    "last_3_months": 90,
+    "last_6_months": 180,
+    "last_year": 365,
+}
+
+# Query generation and filter decisions for near-identical descriptions
+_semantic_cache = SemanticCache(threshold=SEMANTIC_CACHE_THRESHOLD)
+
+# PubMed (articles, metadata) keyed by (query, max_results, sort_by, start_date, end_date)
+_pubmed_cache: TTLCache = TTLCache(maxsize=PUBMED_CACHE_SIZE, ttl=PUBMED_CACHE_TTL)
+_pubmed_cache_lock = threading.Lock()
+
+_client: Optional[anthropic.Anthropic] = None
+
+# LLM steps run here so the search can stop waiting on them when cancelled
+_llm_executor = ThreadPoolExecutor(max_workers=LLM_CALL_WORKERS, thread_name_prefix="pubmed-smart-llm")
+
+
+def _get_client() -> anthropic.Anthropic:
+    """Shared client so searches reuse one HTTP connection pool."""
+    global _client
+    if _client is None:
+        _client = anthropic.Anthropic(
+            api_key=os.getenv('ANTHROPIC_API_KEY'),
+            max_retries=LLM_MAX_RETRIES,
+            timeout=LLM_TIMEOUT_SECONDS
+        )
+    return _client
+
+
+def _search_pubmed_cached(
+    pubmed_service: Any,
+    query: str,
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Tuple[Any, Dict[str, Any]]:
+    """pubmed_service.search_articles, reusing results for the same query within PUBMED_CACHE_TTL."""
+    cache_key = (query, MAX_RESULTS_PER_QUERY, "relevance", start_date, end_date)
+    with _pubmed_cache_lock:
+        cached = _pubmed_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    outcome = pubmed_service.search_articles(
+        query=query,
+        max_results=MAX_RESULTS_PER_QUERY,
+        sort_by="relevance",
+        start_date=start_date,
+        end_date=end_date
+    )
+    with _pubmed_cache_lock:
+        _pubmed_cache[cache_key] = outcome
+    return outcome
+
+
+class _SearchCancelled(Exception):
+    """The cancellation token fired while an LLM step was in flight."""
+
+
+def _call_cancellable(cancellation_token: Optional[Any], fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run an LLM step on the shared executor, polling the cancellation token while
+    it's in flight. On cancel, raise _SearchCancelled without waiting for the call;
+    its late result is discarded.
+    """
+    if cancellation_token is None:
+        return fn(*args)
+    future = _llm_executor.submit(fn, *args)
+    while True:
+        try:
+            return future.result(timeout=CANCEL_POLL_SECONDS)
+        except FuturesTimeout:
+            if cancellation_token.is_cancelled:
+                future.cancel()
+                raise _SearchCancelled()
 
 
 @dataclass
@@ -40,7 +141,6 @@ class SearchQueryResult:
     query: str
     total_hits: int
     articles_fetched: int
-    articles: List[Dict[str, Any]] = field(default_factory=list)
 
 
 @dataclass
@@ -56,87 +156,125 @@ class SmartSearchMeta:
     filtered_out_count: int
 
 
+# Static instructions go in the system prompt; per-call data goes in the user turn
+QUERY_GENERATION_INSTRUCTIONS = """You are a PubMed search expert. You write keyword search queries
+that find articles matching a description.
+
+Guidelines:
+- Use PubMed search syntax (AND, OR, field tags like [Title], [MeSH Terms])
+- Each query should approach the topic from a different angle
+- Include both broad and specific queries
+- Use MeSH terms when appropriate for medical/biological concepts
+- Keep queries focused and likely to return relevant results
+
+Respond with a JSON array of query strings only, no explanation:
+["query1", "query2", ...]"""
+
+SCORING_INSTRUCTIONS = """You are evaluating PubMed articles for semantic relevance.
+
+For each article, score how well it semantically matches the target description
+from 0 (unrelated) to 10 (exactly on topic).
+A keyword match is NOT sufficient - the article must actually be about the topic described.
+
+Respond with a JSON array with one entry per article:
+[{"pmid": "12345", "score": 8}, ...]"""
+
+
+_JSON_DECODER = json.JSONDecoder()
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_FIELD_TAG_RE = re.compile(r'\[[^\]]*\]')
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def _extract_json_array(text: str) -> Optional[List[Any]]:
+    """
+    Return the first JSON array in an LLM response, ignoring code fences and
+    any prose before or after it. None if there is no parseable array.
+    """
+    start = text.find('[')
+    while start != -1:
+        try:
+            value, _ = _JSON_DECODER.raw_decode(text, start)
+            if isinstance(value, list):
+                return value
+        except json.JSONDecodeError:
+            pass
+        start = text.find('[', start + 1)
+    return None
+
+
 def _generate_search_queries(
     client: anthropic.Anthropic,
     semantic_description: str,
     max_queries: int = MAX_QUERIES
-) -> List[str]:
+) -> Tuple[List[str], bool]:
     """
     Use LLM to generate PubMed keyword queries from a semantic description.
+    Returns (queries, fell_back); fell_back is True when the response couldn't
+    be parsed and the queries are a best-effort fallback.
     """
     response = client.messages.create(
         model=SMART_SEARCH_MODEL,
         max_tokens=1024,
         temperature=0.3,
+        system=QUERY_GENERATION_INSTRUCTIONS,
         messages=[{
             "role": "user",
-            "content": f"""You are a PubMed search expert. Generate {max_queries} different keyword search queries
+            "content": f"""Generate {max_queries} different keyword search queries
             that would help find articles matching this description:
 
             "{semantic_description}"
-
-            Guidelines:
-            - Use PubMed search syntax (AND, OR, field tags like [Title], [MeSH Terms])
-            - Each query should approach the topic from a different angle
-            - Include both broad and specific queries
-            - Use MeSH terms when appropriate for medical/biological concepts
-            - Keep queries focused and likely to return relevant results
-
-            Respond with a JSON array of query strings only, no explanation:
-            ["query1", "query2", ...]"""
+            """
         }]
     )
 
     response_text = response.content[0].text.strip()
 
-    # Parse JSON array
-    try:
-        if response_text.startswith("```"):
-            lines = response_text.split("\n")
-            start_idx = 1
-            end_idx = len(lines)
-            for i, line in enumerate(lines[1:], 1):
-                if line.strip() == "```":
-                    end_idx = i
-                    break
-            response_text = "\n".join(lines[start_idx:end_idx]).strip()
-            if response_text.startswith("json"):
-                response_text = response_text[4:].strip()
-
-        queries = json.loads(response_text)
-        if isinstance(queries, list):
-            return queries[:max_queries]
-    except json.JSONDecodeError:
-        logger.warning(f"Failed to parse query generation response: {response_text}")
+    queries = _extract_json_array(response_text)
+    if queries is not None:
+        return queries[:max_queries], False
+    logger.warning(f"Failed to parse query generation response: {response_text}")
 
     # Fallback: extract quoted strings
-    import re
-    quoted = re.findall(r'"([^"]+)"', response_text)
+    quoted = _QUOTED_RE.findall(response_text)
     if quoted:
-        return quoted[:max_queries]
+        return quoted[:max_queries], True
 
     # Last resort: use description as-is
-    return [semantic_description]
+    return [semantic_description], True
 
 
-def _filter_articles_batch(
+def _dedupe_queries(queries: List[str]) -> List[str]:
+    """
+    Drop queries that are near-duplicates of an earlier one: same terms up to
+    case, order and PubMed field tags (Jaccard overlap above QUERY_DUPLICATE_JACCARD).
+    """
+    kept: List[str] = []
+    kept_tokens: List[Set[str]] = []
+    for query in queries:
+        tokens = set(_TOKEN_RE.findall(_FIELD_TAG_RE.sub(" ", query).lower()))
+        if not tokens:
+            continue
+        if any(len(tokens & seen) / len(tokens | seen) > QUERY_DUPLICATE_JACCARD for seen in kept_tokens):
+            continue
+        kept.append(query)
+        kept_tokens.append(tokens)
+    return kept or queries[:1]
+
+
+def _request_scores(
     client: anthropic.Anthropic,
+    model: str,
     articles: List[Dict[str, Any]],
     semantic_description: str
-) -> List[Dict[str, Any]]:
-    """
-    Use LLM to filter a batch of articles based on semantic relevance.
-    Returns only the articles that match the semantic intent.
-    """
-    if not articles:
-        return []
-
-    # Build article summaries for evaluation
+) -> Optional[Dict[str, float]]:
+    """Ask `model` to score articles 0-10; returns PMID -> score, or None if unparseable."""
+    # Build article summaries for evaluation, keyed by PMID
     article_summaries = []
-    for i, article in enumerate(articles):
-        summary = f"""Article {i + 1}:
+    for article in articles:
+        summary = f"""PMID {article['pmid']}:
         Title: {article.get('title', 'N/A')}
-        Abstract: {(article.get('abstract') or 'No abstract available')[:500]}
+        Abstract: {(article.get('abstract') or 'No abstract available')[:SCORING_ABSTRACT_CHARS]}
         Journal: {article.get('journal', 'N/A')}
         """
         article_summaries.append(summary)
@@ -144,59 +282,156 @@ def _filter_articles_batch(
     articles_text = "\n---\n".join(article_summaries)
 
     response = client.messages.create(
-        model=SMART_SEARCH_MODEL,
-        max_tokens=1024,
+        model=model,
+        max_tokens=4096,
         temperature=0.2,
+        system=SCORING_INSTRUCTIONS,
         messages=[{
             "role": "user",
-            "content": f"""You are evaluating PubMed articles for semantic relevance.
-
-            Target: Articles that match this description:
+            "content": f"""Target: Articles that match this description:
             "{semantic_description}"
 
             Articles to evaluate:
             {articles_text}
 
-            For each article, determine if it semantically matches the target description.
-            A keyword match is NOT sufficient - the article must actually be about the topic described.
-
-            Respond with a JSON array of article numbers (1-indexed) that ARE relevant:
-            [1, 3, 5]
-
-            If none are relevant, respond with an empty array: []
-
             JSON response:"""
         }]
     )
 
     response_text = response.content[0].text.strip()
 
+    entries = _extract_json_array(response_text)
+    if entries is None:
+        logger.warning(f"Failed to parse scoring response: {response_text}")
+        return None
+
+    scores = {}
+    for entry in entries:
+        if isinstance(entry, dict) and isinstance(entry.get("score"), (int, float)):
+            scores[str(entry.get("pmid"))] = entry["score"]
+    return scores
+
+
+def _score_articles(
+    client: anthropic.Anthropic,
+    articles: List[Dict[str, Any]],
+    semantic_description: str
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Use LLM to score all candidate articles for semantic relevance in one call.
+    Borderline scores get a second opinion from the stronger model.
+    Returns (articles that match the semantic intent, highest score first,
+    fell_back); fell_back is True when scoring failed and every article is kept.
+    """
+    if not articles:
+        return [], False
+
+    scores = _request_scores(client, SCORING_MODEL, articles, semantic_description)
+    if scores is None:
+        # Fallback: return all articles (conservative)
+        return articles, True
+
+    borderline = [
+        a for a in articles
+        if AMBIGUOUS_MIN_SCORE <= scores.get(a["pmid"], -1) <= RELEVANCE_MIN_SCORE
+    ]
+    if borderline:
+        rescored = _request_scores(client, SMART_SEARCH_MODEL, borderline, semantic_description)
+        if rescored:
+            scores.update((a["pmid"], rescored[a["pmid"]]) for a in borderline if a["pmid"] in rescored)
+
+    scored = [
+        (scores[a["pmid"]], a) for a in articles
+        if scores.get(a["pmid"], -1) >= RELEVANCE_MIN_SCORE
+    ]
+    # Stable sort keeps candidate order among equal scores
+    scored.sort(key=lambda s: -s[0])
+    return [article for _, article in scored], False
+
+
+def _embed_description(description: str) -> Optional[List[float]]:
+    """Embed the description for the semantic cache; None if embeddings are unavailable."""
     try:
-        if response_text.startswith("```"):
-            lines = response_text.split("\n")
-            start_idx = 1
-            end_idx = len(lines)
-            for i, line in enumerate(lines[1:], 1):
-                if line.strip() == "```":
-                    end_idx = i
-                    break
-            response_text = "\n".join(lines[start_idx:end_idx]).strip()
-            if response_text.startswith("json"):
-                response_text = response_text[4:].strip()
-
-        relevant_indices = json.loads(response_text)
-        if isinstance(relevant_indices, list):
-            # Convert to 0-indexed and filter
-            return [
-                articles[idx - 1]
-                for idx in relevant_indices
-                if isinstance(idx, int) and 1 <= idx <= len(articles)
-            ]
-    except json.JSONDecodeError:
-        logger.warning(f"Failed to parse filter response: {response_text}")
-
-    # Fallback: return all articles (conservative)
-    return articles
+        from services.embedding_service import get_embedding_service
+        return get_embedding_service().get_embedding(description)
+    except Exception as e:
+        logger.debug(f"Semantic cache disabled for this search: {e}")
+        return None
+
+
+def _generate_search_queries_cached(
+    client: anthropic.Anthropic,
+    semantic_description: str,
+    embedding: Optional[List[float]]
+) -> List[str]:
+    """_generate_search_queries, reusing queries from a near-identical earlier description."""
+    scope = f"queries:{MAX_QUERIES}"
+    if embedding is not None:
+        cached = _semantic_cache.lookup(scope, embedding)
+        if cached is not None:
+            return json.loads(cached)
+
+    queries, fell_back = _generate_search_queries(client, semantic_description)
+    # A fallback isn't a real answer; caching it would pin it for similar descriptions
+    if embedding is not None and not fell_back:
+        _semantic_cache.add(scope, embedding, json.dumps(queries))
+    return queries
+
+
+def _score_articles_cached(
+    client: anthropic.Anthropic,
+    articles: List[Dict[str, Any]],
+    semantic_description: str,
+    embedding: Optional[List[float]]
+) -> List[Dict[str, Any]]:
+    """_score_articles, reusing the decision for the same articles and a near-identical description."""
+    if embedding is None:
+        return _score_articles(client, articles, semantic_description)[0]
+
+    pmids = sorted(a["pmid"] for a in articles)
+    scope = "filter:" + hashlib.sha256("\0".join(pmids).encode()).hexdigest()
+    cached = _semantic_cache.lookup(scope, embedding)
+    if cached is not None:
+        by_pmid = {a["pmid"]: a for a in articles}
+        return [by_pmid[pmid] for pmid in json.loads(cached) if pmid in by_pmid]
+
+    relevant, fell_back = _score_articles(client, articles, semantic_description)
+    if not fell_back:
+        _semantic_cache.add(scope, embedding, json.dumps([a["pmid"] for a in relevant]))
+    return relevant
+
+
+def _prefilter_by_embedding(
+    articles: List[Dict[str, Any]],
+    description_embedding: Optional[List[float]],
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Drop articles whose embedding is far from the description, most similar first,
+    keeping at most `limit` of them.
+
+    Returns the articles unchanged if embeddings are unavailable.
+    """
+    if description_embedding is None or not articles:
+        return articles
+
+    try:
+        from services.embedding_service import get_embedding_service
+        article_embeddings = get_embedding_service().get_embeddings([
+            f"{a.get('title') or ''} {(a.get('abstract') or '')[:500]}" for a in articles
+        ])
+    except Exception as e:
+        logger.warning(f"Embedding prefilter skipped: {e}")
+        return articles
+
+    matrix = np.asarray(article_embeddings, dtype=np.float32)
+    query = np.asarray(description_embedding, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    scores = matrix @ query / np.where(norms == 0, 1, norms)
+
+    order = np.argsort(-scores, kind="stable")
+    kept = [articles[i] for i in order if scores[i] >= PREFILTER_MIN_SIMILARITY]
+    return kept[:limit] if limit is not None else kept
 
 
 def execute_pubmed_smart_search(
@@ -221,27 +456,19 @@ def execute_pubmed_smart_search(
         return ToolResult(text="Error: No description provided")
 
     cancellation_token = context.get("cancellation_token")
-    client = anthropic.Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+    client = _get_client()
     pubmed_service = PubMedService()
 
     # Calculate date range if specified
     start_date = None
     end_date = None
     if date_range:
-        from datetime import datetime, timedelta
         today = datetime.now()
         end_date = today.strftime("%Y/%m/%d")
 
-        if date_range == "last_week":
-            start_date = (today - timedelta(days=7)).strftime("%Y/%m/%d")
-        elif date_range == "last_month":
-            start_date = (today - timedelta(days=30)).strftime("%Y/%m/%d")
-        elif date_range == "last_3_months":
-            start_date = (today - timedelta(days=90)).strftime("%Y/%m/%d")
-        elif date_range == "last_6_months":
-            start_date = (today - timedelta(days=180)).strftime("%Y/%m/%d")
-        elif date_range == "last_year":
-            start_date = (today - timedelta(days=365)).strftime("%Y/%m/%d")
+        days = _DATE_RANGE_DAYS.get(date_range)
+        if days is not None:
+            start_date = (today - timedelta(days=days)).strftime("%Y/%m/%d")
 
     # Step 1: Generate search queries
     yield ToolProgress(
@@ -254,12 +481,23 @@ def execute_pubmed_smart_search(
     if cancellation_token and cancellation_token.is_cancelled:
         return ToolResult(text="Search cancelled")
 
-    queries = _generate_search_queries(client, description)
+    description_embedding = _embed_description(description)
+    try:
+        queries = _call_cancellable(
+            cancellation_token, _generate_search_queries_cached, client, description, description_embedding
+        )
+    except _SearchCancelled:
+        return ToolResult(text="Search cancelled")
+
+    generated_count = len(queries)
+    queries = _dedupe_queries(queries)
+    duplicates_dropped = generated_count - len(queries)
 
     yield ToolProgress(
         stage="queries_generated",
-        message=f"Generated {len(queries)} search queries",
-        data={"queries": queries},
+        message=f"Generated {len(queries)} search queries"
+        + (f" ({duplicates_dropped} near-duplicates dropped)" if duplicates_dropped else ""),
+        data={"queries": queries, "duplicates_dropped": duplicates_dropped},
         progress=0.2
     )
 
@@ -268,25 +506,61 @@ def execute_pubmed_smart_search(
     query_results: List[SearchQueryResult] = []
     total_hits = 0
 
-    for i, query in enumerate(queries):
-        if cancellation_token and cancellation_token.is_cancelled:
-            return ToolResult(text="Search cancelled")
+    yield ToolProgress(
+        stage="searching",
+        message=f"Executing {len(queries)} searches...",
+        data={"total_queries": len(queries), "queries": queries},
+        progress=0.2
+    )
 
-        yield ToolProgress(
-            stage="searching",
-            message=f"Executing search {i + 1}/{len(queries)}: {query[:50]}...",
-            data={"query_index": i + 1, "total_queries": len(queries), "query": query},
-            progress=0.2 + (0.3 * (i / len(queries)))
-        )
+    # Queries run concurrently; results are merged afterwards in query order so
+    # dedup and article order don't depend on which search finished first
+    outcomes: List[Optional[Tuple[Any, Dict[str, Any]]]] = [None] * len(queries)
 
-        try:
-            articles, metadata = pubmed_service.search_articles(
+    # Not a `with` block: its exit would wait for in-flight requests even after a cancel
+    executor = ThreadPoolExecutor(max_workers=SEARCH_CONCURRENCY)
+    try:
+        futures = {
+            executor.submit(_search_pubmed_cached, pubmed_service, query, start_date, end_date): i
+            for i, query in enumerate(queries)
+        }
+
+        pending = set(futures)
+        done = 0
+        while pending:
+            finished, pending = wait(pending, timeout=CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+            if cancellation_token and cancellation_token.is_cancelled:
+                return ToolResult(text="Search cancelled")
+
+            for future in finished:
+                done += 1
+                i = futures[future]
+                try:
+                    outcomes[i] = future.result()
+                except Exception as e:
+                    logger.error(f"Error executing query '{queries[i]}': {e}")
+
+                yield ToolProgress(
+                    stage="searching",
+                    message=f"Completed search {done}/{len(queries)}: {queries[i][:50]}...",
+                    data={"query_index": i + 1, "total_queries": len(queries), "query": queries[i]},
+                    progress=0.2 + (0.3 * (done / len(queries)))
+                )
+    finally:
+        # Drop queued searches and return without waiting on ones still in flight
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    for query, outcome in zip(queries, outcomes):
+        if outcome is None:
+            query_results.append(SearchQueryResult(
                 query=query,
-                max_results=MAX_RESULTS_PER_QUERY,
-                sort_by="relevance",
-                start_date=start_date,
-                end_date=end_date
-            )
+                total_hits=0,
+                articles_fetched=0
+            ))
+            continue
+
+        try:
+            articles, metadata = outcome
 
             query_total = metadata.get("total_results", 0)
             total_hits += query_total
@@ -310,15 +584,12 @@ def execute_pubmed_smart_search(
                         "pmid": pmid,
                         "title": article.title,
                         "authors": article.authors,
-                        "authors_display": ", ".join(article.authors[:3]) + (" et al." if len(article.authors) > 3 else "") if article.authors else "",
                         "journal": article.journal,
                         "publication_date": article.publication_date,
-                        "abstract": article.abstract,
-                        "url": f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
+                        "abstract": article.abstract
                     }
                     new_count += 1
 
-            query_result.articles = [all_articles[a.pmid] for a in articles if a.pmid in all_articles]
             query_results.append(query_result)
 
             logger.info(f"Query '{query}': {query_total} total, {len(articles)} fetched, {new_count} new unique")
@@ -368,45 +639,39 @@ def execute_pubmed_smart_search(
             }
         )
 
-    # Step 3: Filter articles semantically
+    # Step 3: Filter articles semantically. A cheap embedding-similarity pass
+    # drops clear misses and keeps only the closest few per requested result, so
+    # the LLM scores the likeliest articles instead of the whole long tail
+    candidates = _prefilter_by_embedding(
+        articles_before_filter,
+        description_embedding,
+        limit=max_results * SCORING_CANDIDATES_PER_RESULT
+    )
+    if len(candidates) < len(articles_before_filter):
+        logger.info(f"Embedding prefilter kept {len(candidates)}/{len(articles_before_filter)} articles")
+
     yield ToolProgress(
         stage="filtering",
         message="Filtering articles by semantic relevance...",
-        data={"articles_to_filter": len(articles_before_filter)},
+        data={"articles_to_filter": len(candidates)},
         progress=0.6
     )
 
-    filtered_articles: List[Dict[str, Any]] = []
-
-    # Process in batches
-    for batch_start in range(0, len(articles_before_filter), BATCH_SIZE_FOR_FILTERING):
-        if cancellation_token and cancellation_token.is_cancelled:
-            return ToolResult(text="Search cancelled")
-
-        batch = articles_before_filter[batch_start:batch_start + BATCH_SIZE_FOR_FILTERING]
-        batch_num = batch_start // BATCH_SIZE_FOR_FILTERING + 1
-        total_batches = (len(articles_before_filter) + BATCH_SIZE_FOR_FILTERING - 1) // BATCH_SIZE_FOR_FILTERING
-
-        yield ToolProgress(
-            stage="filtering",
-            message=f"Filtering batch {batch_num}/{total_batches}...",
-            data={
-                "batch": batch_num,
-                "total_batches": total_batches,
-                "filtered_so_far": len(filtered_articles)
-            },
-            progress=0.6 + (0.3 * (batch_start / len(articles_before_filter)))
+    try:
+        filtered_articles = _call_cancellable(
+            cancellation_token, _score_articles_cached, client, candidates, description, description_embedding
         )
-
-        relevant = _filter_articles_batch(client, batch, description)
-        filtered_articles.extend(relevant)
-
-        # Stop if we have enough
-        if len(filtered_articles) >= max_results:
-            break
+    except _SearchCancelled:
+        return ToolResult(text="Search cancelled")
 
     # Limit to max_results
     filtered_articles = filtered_articles[:max_results]
+
+    # Display fields are only built for the articles that survived filtering
+    for article in filtered_articles:
+        authors = article["authors"]
+        article["authors_display"] = ", ".join(authors[:3]) + (" et al." if len(authors) > 3 else "") if authors else ""
+        article["url"] = f"https://pubmed.ncbi.nlm.nih.gov/{article['pmid']}/"
     filtered_out_count = len(articles_before_filter) - len(filtered_articles)
 
     yield ToolProgress(
@@ -436,40 +701,40 @@ def execute_pubmed_smart_search(
     )
 
     # Build formatted output
-    formatted = f"**PubMed Smart Search Results**\n"
-    formatted += f"Query: \"{description}\"\n\n"
-    formatted += f"**Search Statistics:**\n"
-    formatted += f"- Generated {len(queries)} keyword searches\n"
-    formatted += f"- Total hits across searches: {total_hits}\n"
-    formatted += f"- Unique articles found: {len(articles_before_filter)}\n"
-    formatted += f"- After semantic filtering: {len(filtered_articles)}\n"
-    formatted += f"- Filtered out (not relevant): {filtered_out_count}\n\n"
-
-    formatted += "**Generated Searches:**\n"
+    parts = [f"**PubMed Smart Search Results**\n"]
+    parts.append(f"Query: \"{description}\"\n\n")
+    parts.append(f"**Search Statistics:**\n")
+    parts.append(f"- Generated {len(queries)} keyword searches\n")
+    parts.append(f"- Total hits across searches: {total_hits}\n")
+    parts.append(f"- Unique articles found: {len(articles_before_filter)}\n")
+    parts.append(f"- After semantic filtering: {len(filtered_articles)}\n")
+    parts.append(f"- Filtered out (not relevant): {filtered_out_count}\n\n")
+
+    parts.append("**Generated Searches:**\n")
     for i, qr in enumerate(query_results, 1):
-        formatted += f"{i}. `{qr.query}` - {qr.total_hits} hits\n"
-    formatted += "\n"
+        parts.append(f"{i}. `{qr.query}` - {qr.total_hits} hits\n")
+    parts.append("\n")
 
-    formatted += f"**Relevant Articles ({len(filtered_articles)}):**\n\n"
+    parts.append(f"**Relevant Articles ({len(filtered_articles)}):**\n\n")
 
     for i, article in enumerate(filtered_articles, 1):
-        formatted += f"**{i}. {article['title']}**\n"
+        parts.append(f"**{i}. {article['title']}**\n")
         if article['authors_display']:
-            formatted += f"   Authors: {article['authors_display']}\n"
+            parts.append(f"   Authors: {article['authors_display']}\n")
         if article['journal']:
-            formatted += f"   Journal: {article['journal']}"
+            parts.append(f"   Journal: {article['journal']}")
             if article['publication_date']:
-                formatted += f" ({article['publication_date']})"
-            formatted += "\n"
+                parts.append(f" ({article['publication_date']})")
+            parts.append("\n")
         if article['pmid']:
-            formatted += f"   PMID: {article['pmid']}\n"
-            formatted += f"   URL: {article['url']}\n"
+            parts.append(f"   PMID: {article['pmid']}\n")
+            parts.append(f"   URL: {article['url']}\n")
         if article.get('abstract'):
             abstract_preview = article['abstract'][:300]
             if len(article['abstract']) > 300:
                 abstract_preview += "..."
-            formatted += f"   Abstract: {abstract_preview}\n"
-        formatted += "\n"
+            parts.append(f"   Abstract: {abstract_preview}\n")
+        parts.append("\n")
 
     # Build table payload
     table_payload = {
@@ -502,7 +767,7 @@ def execute_pubmed_smart_search(
     }
 
     return ToolResult(
-        text=formatted,
+        text="".join(parts),
         data={
             "success": True,
             "articles": filtered_articles,
@@ -512,6 +777,7 @@ def execute_pubmed_smart_search(
     )
 
 
+# Registered on import
 PUBMED_SMART_SEARCH_TOOL = ToolConfig(
     name="pubmed_smart_search",
     description="""Semantic search for PubMed articles using natural language.
@@ -557,10 +823,4 @@ For simple keyword searches, use pubmed_search instead.""",
     executor=execute_pubmed_smart_search,
     category="research",
     streaming=True
-)
-
-
-def register_pubmed_smart_search_tools():
-    """Register the pubmed_smart_search tool."""
-    register_tool(PUBMED_SMART_SEARCH_TOOL)
-    logger.info("Registered pubmed_smart_search tool")
+).register()
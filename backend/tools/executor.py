@@ -6,7 +6,10 @@ for executing tools (both streaming and non-streaming).
 """
 
 import asyncio
+import concurrent.futures
 import os
+import sys
+import threading
 import types
 import logging
 from dataclasses import dataclass
@@ -335,3 +338,26 @@ def run_async(coro: Coroutine[Any, Any, T]) -> T:
     """
     return asyncio.run(coro)
 
+
+# Long-lived event loop on a daemon thread. Sync tool executors submit coroutines
+# here so async clients (HTTP sessions, browsers, AsyncAnthropic) stay bound to one
+# loop and can be reused across calls, instead of a fresh loop per asyncio.run().
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Start (once) and return the shared background event loop."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            # On Windows, we need ProactorEventLoop for subprocess support (used by Playwright)
+            loop = asyncio.ProactorEventLoop() if sys.platform == 'win32' else asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="tool-background-loop", daemon=True).start()
+            _background_loop = loop
+    return _background_loop
+
+
+def submit_to_background_loop(coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+    """Schedule a coroutine on the shared background loop and return its future."""
+    return asyncio.run_coroutine_threadsafe(coro, get_background_loop())
@@ -5,7 +5,7 @@ Global registry of tools available to the primary agent.
 Tools are capabilities the agent can invoke regardless of UI state.
 """
 
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from dataclasses import dataclass
 from sqlalchemy.orm import Session
 
@@ -39,16 +39,28 @@ class ToolConfig:
     category: str = "general"  # Tool category for organization
     streaming: bool = False  # If True, executor yields ToolProgress before returning ToolResult
 
+    def register(self) -> "ToolConfig":
+        """Register this tool in the global registry and return it."""
+        _tool_registry.register(self)
+        return self
+
 
 class ToolRegistry:
     """Global registry of tools available to the primary agent."""
 
     def __init__(self):
         self._tools: Dict[str, ToolConfig] = {}
+        self._anthropic_format: Optional[List[Dict[str, Any]]] = None
 
     def register(self, tool: ToolConfig):
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._anthropic_format = None
+
+    def register_many(self, tools: Iterable[ToolConfig]):
+        """Register several tools, invalidating derived state once."""
+        self._tools.update((tool.name, tool) for tool in tools)
+        self._anthropic_format = None
 
     def get(self, name: str) -> Optional[ToolConfig]:
         """Get a tool by name."""
@@ -63,15 +75,17 @@ class ToolRegistry:
         return [t for t in self._tools.values() if t.category == category]
 
     def to_anthropic_format(self) -> List[Dict[str, Any]]:
-        """Convert all tools to Anthropic API format."""
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.input_schema
-            }
-            for tool in self._tools.values()
-        ]
+        """Convert all tools to Anthropic API format (built once per registry change)."""
+        if self._anthropic_format is None:
+            self._anthropic_format = [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "input_schema": tool.input_schema
+                }
+                for tool in self._tools.values()
+            ]
+        return list(self._anthropic_format)
 
 
 # Global registry instance
@@ -83,6 +97,11 @@ def register_tool(tool: ToolConfig):
     _tool_registry.register(tool)
 
 
+def register_tools(tools: Iterable[ToolConfig]):
+    """Register several tools in the global registry."""
+    _tool_registry.register_many(tools)
+
+
 def get_tool(name: str) -> Optional[ToolConfig]:
     """Get a tool by name."""
     return _tool_registry.get(name)
@@ -4,7 +4,8 @@ Workflow Registry
 Central registry for all available workflow graph templates.
 """
 
-from typing import Dict, List, Optional
+import threading
+from typing import Callable, Dict, List, Optional
 from schemas.workflow import WorkflowGraph
 
 
@@ -12,20 +13,46 @@ class WorkflowRegistry:
     """
     Registry for workflow graph definitions.
 
-    Workflows are registered at startup and can be retrieved by ID.
+    Workflows are registered at startup and can be retrieved by ID. Templates
+    registered with register_lazy() are built on first lookup.
     """
 
-    _instance: Optional["WorkflowRegistry"] = None
-
     def __init__(self):
         self._workflows: Dict[str, WorkflowGraph] = {}
-
-    @classmethod
-    def get_instance(cls) -> "WorkflowRegistry":
-        """Get the singleton registry instance."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        # Maintained by register() so category lookups don't scan every workflow
+        self._by_category: Dict[str, List[WorkflowGraph]] = {}
+        # API serializations, built once at register time (graphs don't change afterwards)
+        self._dict_cache: Dict[str, Dict] = {}
+        self._summaries: List[Dict] = []
+        # Workflow ID -> factory for templates not imported yet
+        self._lazy: Dict[str, Callable[[], WorkflowGraph]] = {}
+        self._lazy_lock = threading.RLock()  # Re-entrant: factories may register() on import
+
+    def register_lazy(self, workflow_id: str, factory: Callable[[], WorkflowGraph]) -> None:
+        """Register a workflow whose definition is only built (imported) when first looked up."""
+        if workflow_id in self._workflows or workflow_id in self._lazy:
+            raise ValueError(f"Workflow '{workflow_id}' is already registered")
+        self._lazy[workflow_id] = factory
+
+    def _load(self, workflow_id: str) -> None:
+        """Build a lazily registered workflow, if it hasn't been yet."""
+        # Entries leave _lazy only once fully registered, so a miss here is final
+        if workflow_id not in self._lazy:
+            return
+        with self._lazy_lock:
+            # Another thread may have finished loading it while we waited
+            factory = self._lazy.get(workflow_id)
+            if factory is None:
+                return
+            workflow = factory()
+            # Templates that call .register() at import are already in place
+            if workflow.id not in self._workflows:
+                self.register(workflow)
+            self._lazy.pop(workflow_id, None)
+
+    def _load_all(self) -> None:
+        for workflow_id in list(self._lazy):
+            self._load(workflow_id)
 
     def register(self, workflow: WorkflowGraph) -> None:
         """Register a workflow graph definition."""
@@ -38,29 +65,51 @@ class WorkflowRegistry:
             raise ValueError(f"Invalid workflow '{workflow.id}': {errors}")
 
         self._workflows[workflow.id] = workflow
+        self._by_category.setdefault(workflow.category, []).append(workflow)
+        self._dict_cache[workflow.id] = self._serialize(workflow)
+        self._summaries.append({
+            "id": workflow.id,
+            "name": workflow.name,
+            "description": workflow.description,
+            "icon": workflow.icon,
+            "category": workflow.category,
+        })
+        # Last, so concurrent lazy lookups never see a half-registered workflow
+        self._lazy.pop(workflow.id, None)
 
     def get(self, workflow_id: str) -> Optional[WorkflowGraph]:
         """Get a workflow graph by ID."""
+        self._load(workflow_id)
         return self._workflows.get(workflow_id)
 
     def get_all(self) -> List[WorkflowGraph]:
         """Get all registered workflow graphs."""
+        self._load_all()
         return list(self._workflows.values())
 
     def get_by_category(self, category: str) -> List[WorkflowGraph]:
         """Get all workflows in a category."""
-        return [w for w in self._workflows.values() if w.category == category]
+        self._load_all()
+        return list(self._by_category.get(category, ()))
 
     def list_categories(self) -> List[str]:
         """Get all unique categories."""
-        return list(set(w.category for w in self._workflows.values()))
+        self._load_all()
+        return list(self._by_category)
 
     def to_dict(self, workflow_id: str) -> Optional[Dict]:
         """Get a workflow graph as a dict for API responses."""
-        workflow = self.get(workflow_id)
-        if not workflow:
-            return None
+        self._load(workflow_id)
+        return self._dict_cache.get(workflow_id)
 
+    def list_all_dict(self) -> List[Dict]:
+        """Get all workflows as dicts for API responses."""
+        self._load_all()
+        return list(self._summaries)
+
+    @staticmethod
+    def _serialize(workflow: WorkflowGraph) -> Dict:
+        """Build the API dict for a workflow graph."""
         return {
             "id": workflow.id,
             "name": workflow.name,
@@ -98,19 +147,6 @@ class WorkflowRegistry:
             ]
         }
 
-    def list_all_dict(self) -> List[Dict]:
-        """Get all workflows as dicts for API responses."""
-        return [
-            {
-                "id": w.id,
-                "name": w.name,
-                "description": w.description,
-                "icon": w.icon,
-                "category": w.category,
-            }
-            for w in self._workflows.values()
-        ]
-
-
-# Global registry instance
-workflow_registry = WorkflowRegistry.get_instance()
+
+# Global registry instance, created once at import (module import is serialized)
+workflow_registry = WorkflowRegistry()
@@ -2,25 +2,32 @@
 Workflow Templates
 
 Pre-built workflow templates that users can instantiate.
+
+Templates are registered lazily: each module (and its LLM/tool dependencies)
+is only imported the first time the workflow is looked up, at which point its
+own .register() call adds it to the registry.
 """
 
-from .research import research_workflow
-from .simple_search import simple_search_workflow
-from .vendor_finder import vendor_finder_workflow
+import importlib
+
+from ..registry import workflow_registry
+
+# Workflow ID -> (template module, module attribute holding the graph)
+TEMPLATE_MODULES = {
+    "research": ("workflows.templates.research", "research_workflow"),
+    "simple_search": ("workflows.templates.simple_search", "simple_search_workflow"),
+    "vendor_finder": ("workflows.templates.vendor_finder", "vendor_finder_workflow"),
+}
+
 
+def _template_factory(module_name: str, attr: str):
+    return lambda: getattr(importlib.import_module(module_name), attr)
 
-def register_all_workflows():
-    """Register all built-in workflow templates."""
-    from ..registry import workflow_registry
 
-    workflow_registry.register(research_workflow)
-    workflow_registry.register(simple_search_workflow)
-    workflow_registry.register(vendor_finder_workflow)
+for _workflow_id, (_module_name, _attr) in TEMPLATE_MODULES.items():
+    workflow_registry.register_lazy(_workflow_id, _template_factory(_module_name, _attr))
 
 
 __all__ = [
-    "research_workflow",
-    "simple_search_workflow",
-    "vendor_finder_workflow",
-    "register_all_workflows",
+    "TEMPLATE_MODULES",
 ]
@@ -871,4 +871,4 @@ research_workflow = WorkflowGraph(
         Edge(from_node="compile_final", to_node="final_checkpoint"),
         # final_checkpoint has no outgoing edges = end of workflow
     ]
-)
+).register()
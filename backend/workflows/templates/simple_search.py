@@ -429,4 +429,4 @@ simple_search_workflow = WorkflowGraph(
         Edge(from_node="generate_answer", to_node="answer_checkpoint"),
         # answer_checkpoint has no outgoing edges = workflow complete
     ]
-)
+).register()
@@ -1128,4 +1128,4 @@ vendor_finder_workflow = WorkflowGraph(
         Edge(from_node="analyze_and_recommend", to_node="final_checkpoint"),
         # final_checkpoint has no outgoing edges = workflow complete
     ]
-)
+).register()